@@ -8,8 +8,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from podagent.models.manifest import Manifest
-from podagent.utils.io import read_yaml
+from podagent.pipeline.orchestrator import load_manifest
 from podagent.utils.progress import log_error
 
 console = Console()
@@ -42,8 +41,9 @@ def status_cmd(manifest: str) -> None:
         log_error(f"Manifest not found: {manifest_path}")
         raise SystemExit(1)
 
-    data = read_yaml(manifest_path)
-    m = Manifest(**data)
+    # Prefers a newer checkpoint, so a running or killed pipeline shows its
+    # latest stage state rather than the last full manifest.yaml save.
+    m = load_manifest(manifest_path)
 
     # Project info
     console.print(f"\n[bold]{m.project.name}[/bold] — Episode {m.project.episode_number}")
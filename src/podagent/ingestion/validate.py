@@ -6,7 +6,7 @@ from pathlib import Path
 
 from podagent.models.manifest import Manifest, SourceTrack
 from podagent.utils.ffmpeg import resample
-from podagent.utils.ffprobe import AudioInfo, probe_audio
+from podagent.utils.ffprobe import AudioInfo, probe_audio, probe_many
 from podagent.utils.progress import log, log_step, log_warning
 
 
@@ -29,14 +29,16 @@ def validate_tracks(
     """
     track_infos: list[AudioInfo] = []
 
+    track_paths = []
     for participant in manifest.project.participants:
         track_path = project_root / participant.track
         if not track_path.exists():
             raise FileNotFoundError(
                 f"Track not found: {track_path} (for {participant.name})"
             )
+        track_paths.append(track_path)
 
-        info = probe_audio(track_path)
+    for track_path, info in zip(track_paths, probe_many(track_paths)):
         log_step(
             "Validate",
             f"{track_path.name} — "
@@ -29,7 +29,8 @@ def verify_output(
             "-af", "ebur128=peak=true",
             "-f", "null", "-",
         ],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
     )
 
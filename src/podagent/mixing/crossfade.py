@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from podagent.utils.ffmpeg import FFmpegError, run_ffmpeg
+from podagent.utils.ffmpeg import INTERMEDIATE_CODEC, FFmpegError, run_ffmpeg
 from podagent.utils.progress import log_warning
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def apply_crossfade(
     region_a: Path,
@@ -25,13 +28,20 @@ def apply_crossfade(
     """
     duration_s = duration_ms / 1000.0
 
+    try:
+        if _crossfade_streaming(region_a, region_b, output, duration_s, curve):
+            return
+    except (ImportError, RuntimeError):
+        # RuntimeError covers soundfile.LibsndfileError (unreadable region)
+        pass
+
     try:
         run_ffmpeg([
             "-i", str(region_a),
             "-i", str(region_b),
             "-filter_complex",
             f"acrossfade=d={duration_s}:c1={curve}:c2={curve}",
-            "-c:a", "pcm_s24le",
+            "-c:a", INTERMEDIATE_CODEC,
             str(output),
         ])
     except FFmpegError:
@@ -42,6 +52,82 @@ def apply_crossfade(
         concatenate(region_a, region_b, output)
 
 
+# Block size for streaming the untouched bodies of each region
+_STREAM_BLOCK_FRAMES = 1 << 16
+
+
+def _fade_in_gain(t: np.ndarray, curve: str) -> np.ndarray | None:
+    """Fade-in gain for normalized time t in [0, 1], matching acrossfade curves."""
+    import numpy as np
+
+    if curve == "tri":
+        return t
+    if curve == "exp":
+        return np.exp(-11.512925464970227 * (1.0 - t))
+    if curve == "log":
+        with np.errstate(divide="ignore"):
+            return np.clip(1.0 + 0.2 * np.log10(t), 0.0, 1.0)
+    return None
+
+
+def _crossfade_streaming(
+    region_a: Path,
+    region_b: Path,
+    output: Path,
+    duration_s: float,
+    curve: str,
+) -> bool:
+    """Crossfade by decoding only the overlapping samples.
+
+    The bodies of both regions are streamed through in blocks; only the
+    last/first duration_s of a/b are mixed in NumPy. Returns False if the
+    inputs cannot be handled here (format mismatch, too short, unknown
+    curve) so the caller can fall back to FFmpeg.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    with sf.SoundFile(str(region_a)) as fa, sf.SoundFile(str(region_b)) as fb:
+        if fa.samplerate != fb.samplerate or fa.channels != fb.channels:
+            return False
+
+        n = round(duration_s * fa.samplerate)
+        if n <= 0 or fa.frames < n or fb.frames < n:
+            return False
+
+        t = np.linspace(0.0, 1.0, n, dtype=np.float64)
+        fade_in = _fade_in_gain(t, curve)
+        if fade_in is None:
+            return False
+        fade_out = _fade_in_gain(1.0 - t, curve)
+
+        with sf.SoundFile(
+            str(output),
+            mode="w",
+            samplerate=fa.samplerate,
+            channels=fa.channels,
+            subtype="FLOAT",
+        ) as out:
+            # Body of a, up to the crossfade
+            remaining = fa.frames - n
+            while remaining > 0:
+                block = fa.read(min(_STREAM_BLOCK_FRAMES, remaining), dtype="float32", always_2d=True)
+                out.write(block)
+                remaining -= len(block)
+
+            # Overlap
+            tail = fa.read(n, dtype="float32", always_2d=True)
+            head = fb.read(n, dtype="float32", always_2d=True)
+            mixed = tail * fade_out[:, None] + head * fade_in[:, None]
+            out.write(mixed.astype(np.float32))
+
+            # Rest of b
+            for block in fb.blocks(blocksize=_STREAM_BLOCK_FRAMES, dtype="float32", always_2d=True):
+                out.write(block)
+
+    return True
+
+
 def concatenate(file_a: Path, file_b: Path, output: Path) -> None:
     """Concatenate two audio files without crossfade."""
     # Create concat list file
@@ -52,7 +138,7 @@ def concatenate(file_a: Path, file_b: Path, output: Path) -> None:
         "-f", "concat",
         "-safe", "0",
         "-i", str(list_path),
-        "-c:a", "pcm_s24le",
+        "-c:a", INTERMEDIATE_CODEC,
         str(output),
     ])
 
@@ -77,7 +163,7 @@ def concatenate_all(files: list[Path], output: Path) -> None:
         "-f", "concat",
         "-safe", "0",
         "-i", str(list_path),
-        "-c:a", "pcm_s24le",
+        "-c:a", INTERMEDIATE_CODEC,
         str(output),
     ])
 
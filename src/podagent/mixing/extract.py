@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from podagent.mixing.timeline import AudioRegion
-from podagent.utils.ffmpeg import extract_region
+from podagent.utils.ffmpeg import build_extract_batches, run_ffmpeg_parallel
 from podagent.utils.progress import log_step
 
 
@@ -15,14 +15,16 @@ def extract_regions(
     tmp_dir: Path,
     *,
     sample_rate: int = 48000,
-    bit_depth: int = 24,
 ) -> dict[str, Path]:
     """Extract audio regions from source tracks.
 
-    Returns a mapping of edit_id → extracted file path.
+    Regions are grouped by source track and extracted in multi-output FFmpeg
+    batches; batches for all tracks run concurrently. Returns a mapping of
+    edit_id → extracted file path.
     """
     tmp_dir.mkdir(parents=True, exist_ok=True)
     extracted: dict[str, Path] = {}
+    by_track: dict[Path, list[tuple[Path, float, float]]] = {}
 
     log_step("Extract", f"Extracting {len(regions)} audio regions...")
 
@@ -41,17 +43,18 @@ def extract_regions(
         adjusted_start = region.source_start + (region.offset_ms / 1000.0)
         adjusted_start = max(adjusted_start, 0.0)
 
-        extract_region(
+        by_track.setdefault(track_path, []).append((output_path, adjusted_start, duration))
+        extracted[region.edit_id] = output_path
+
+    jobs = []
+    for track_path, track_regions in by_track.items():
+        jobs.extend(build_extract_batches(
             track_path,
-            output_path,
-            start=adjusted_start,
-            duration=duration,
+            track_regions,
             sample_rate=sample_rate,
             channels=1,
-            bit_depth=bit_depth,
-        )
-
-        extracted[region.edit_id] = output_path
+        ))
+    run_ffmpeg_parallel(jobs)
 
     log_step("Extract", f"Extracted {len(extracted)} regions to {tmp_dir}")
     return extracted
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from podagent.utils.ffmpeg import run_ffmpeg
+from podagent.utils.ffmpeg import INTERMEDIATE_CODEC, run_ffmpeg
 from podagent.utils.progress import log_step
 
 
@@ -29,11 +29,10 @@ def mixdown(
     if len(track_paths) == 1:
         # Single track: convert to stereo
         log_step("Mixdown", "Single track → stereo")
-        codec = f"pcm_s{bit_depth}le"
         run_ffmpeg([
             "-i", str(track_paths[0]),
             "-ac", "2",
-            "-c:a", codec,
+            "-c:a", INTERMEDIATE_CODEC,
             "-ar", str(sample_rate),
             str(output_path),
         ])
@@ -63,12 +62,11 @@ def mixdown(
     )
 
     filter_complex = ";".join(filter_parts)
-    codec = f"pcm_s{bit_depth}le"
 
     run_ffmpeg(
         inputs + [
             "-filter_complex", filter_complex,
-            "-c:a", codec,
+            "-c:a", INTERMEDIATE_CODEC,
             "-ar", str(sample_rate),
             str(output_path),
         ]
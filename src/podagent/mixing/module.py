@@ -5,14 +5,25 @@ from __future__ import annotations
 import shutil
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from podagent.models.alignment import AlignmentMap
 from podagent.models.edl import EDLSidecar
 from podagent.models.manifest import Manifest
-from podagent.utils.ffmpeg import generate_waveform
-from podagent.utils.io import read_json, write_json
+from podagent.models.transcript import Transcript
+from podagent.utils.ffmpeg import (
+    FFmpegError,
+    extract_and_filter,
+    generate_waveform,
+    run_ffmpeg,
+)
+from podagent.utils.io import find_missing, read_json, write_json
 from podagent.utils.progress import log_step, log_success, log_warning
 
+if TYPE_CHECKING:
+    from podagent.mixing.timeline import AudioRegion
+    from podagent.models.config import MixingConfig
+
 
 class MixingModule:
     """Module 3: Audio Processing & Mixing.
@@ -33,14 +44,16 @@ class MixingModule:
     def validate_inputs(self, project_root: Path, manifest: Manifest) -> list[str]:
         errors = []
         edl_path = project_root / manifest.files.edl_sidecar
-        if not edl_path.exists():
-            errors.append(f"EDL sidecar not found: {edl_path}")
         alignment_path = project_root / manifest.files.alignment_map
-        if not alignment_path.exists():
+        track_paths = [project_root / p.track for p in manifest.project.participants]
+        missing = find_missing([edl_path, alignment_path, *track_paths])
+
+        if edl_path in missing:
+            errors.append(f"EDL sidecar not found: {edl_path}")
+        if alignment_path in missing:
             errors.append(f"Alignment map not found: {alignment_path}")
-        for p in manifest.project.participants:
-            track_path = project_root / p.track
-            if not track_path.exists():
+        for track_path in track_paths:
+            if track_path in missing:
                 errors.append(f"Source track not found: {track_path}")
         return errors
 
@@ -68,66 +81,11 @@ class MixingModule:
         regions = build_timeline(edl, alignment, track_map)
         manifest.get_stage("mixing").last_completed_step = "timeline"
 
-        # Step 2: Extract audio regions
-        from podagent.mixing.extract import extract_regions
-
-        extracted = extract_regions(
-            regions,
-            project_root,
-            tmp_dir,
-            sample_rate=config.output_sample_rate,
-            bit_depth=config.output_bit_depth,
-        )
-        manifest.get_stage("mixing").last_completed_step = "extract"
-
-        # Step 3: Per-track processing
-        processing_log: dict[str, list[dict]] = {}
-
-        if config.noise_reduction_provider != "none" or config.compression_enabled:
-            from podagent.mixing.processing import process_region
-
-            log_step("Processing", f"Applying audio processing ({len(extracted)} regions)...")
-
-            for edit_id, region_path in extracted.items():
-                processed_path = tmp_dir / f"{region_path.stem}_processed{region_path.suffix}"
-                steps = process_region(region_path, processed_path, config)
-                extracted[edit_id] = processed_path
-                # Group by track for logging
-                region = next((r for r in regions if r.edit_id == edit_id), None)
-                track_key = region.track_path if region else "unknown"
-                if track_key not in processing_log:
-                    processing_log[track_key] = steps
-        manifest.get_stage("mixing").last_completed_step = "processing"
-
-        # Step 4: Assemble with crossfades
-        from podagent.mixing.crossfade import apply_crossfade, concatenate_all
-
-        ordered_paths = []
-        for region in regions:
-            if region.edit_id in extracted:
-                ordered_paths.append(extracted[region.edit_id])
-
-        if config.crossfade_duration_ms > 0 and len(ordered_paths) > 1:
-            log_step("Crossfade", f"Applying crossfades ({len(ordered_paths) - 1} edit points)...")
-            # Apply crossfades sequentially
-            current = ordered_paths[0]
-            crossfade_count = 0
-            for i in range(1, len(ordered_paths)):
-                output = tmp_dir / f"xfade_{i:04d}.wav"
-                apply_crossfade(
-                    current,
-                    ordered_paths[i],
-                    output,
-                    duration_ms=config.crossfade_duration_ms,
-                    curve=config.crossfade_curve,
-                )
-                current = output
-                crossfade_count += 1
-            assembled_path = current
-        else:
-            assembled_path = tmp_dir / "assembled.wav"
-            concatenate_all(ordered_paths, assembled_path)
-            crossfade_count = 0
+        # Steps 2-4: Extract, process and assemble regions
+        assembled = self._assemble_single_pass(regions, project_root, tmp_dir, config)
+        if assembled is None:
+            assembled = self._assemble_regions(regions, project_root, tmp_dir, manifest)
+        assembled_path, processing_log, crossfade_count = assembled
 
         manifest.get_stage("mixing").last_completed_step = "crossfade"
 
@@ -159,17 +117,30 @@ class MixingModule:
         final_path = assembled_path
 
         if config.music_intro_path:
-            from podagent.mixing.music_bed import mix_intro_music
+            from podagent.mixing.music_bed import mix_intro_music, mix_intro_music_numpy
             music_path = project_root / config.music_intro_path
             if music_path.exists():
                 intro_output = tmp_dir / "with_intro.wav"
+                speech_regions = self._speech_regions(regions, project_root, manifest)
                 try:
-                    mix_intro_music(
-                        final_path,
-                        music_path,
-                        intro_output,
-                        music_volume_db=config.music_volume_db,
-                    )
+                    try:
+                        if speech_regions is None:
+                            raise ValueError("no transcript to place the ducking")
+                        mix_intro_music_numpy(
+                            final_path,
+                            music_path,
+                            intro_output,
+                            speech_regions,
+                            music_volume_db=config.music_volume_db,
+                        )
+                    except (ImportError, ValueError, RuntimeError):
+                        # RuntimeError covers soundfile.LibsndfileError
+                        mix_intro_music(
+                            final_path,
+                            music_path,
+                            intro_output,
+                            music_volume_db=config.music_volume_db,
+                        )
                     final_path = intro_output
                 except Exception as e:
                     log_warning(f"Intro music failed: {e}")
@@ -192,9 +163,13 @@ class MixingModule:
 
         manifest.get_stage("mixing").last_completed_step = "music"
 
-        # Copy final mix to output location
+        # Quantize the float intermediate once into the final output
         mixed_output = artifacts_dir / "mixed.wav"
-        shutil.copy2(final_path, mixed_output)
+        run_ffmpeg([
+            "-i", str(final_path),
+            "-c:a", f"pcm_s{config.output_bit_depth}le",
+            str(mixed_output),
+        ])
 
         # Step 7: Waveform preview
         waveform_path = artifacts_dir / "waveform.png"
@@ -244,3 +219,141 @@ class MixingModule:
             f"{mixed_info.sample_rate}Hz, "
             f"{mixed_info.bit_depth or config.output_bit_depth}-bit"
         )
+
+    def _speech_regions(
+        self,
+        regions: list[AudioRegion],
+        project_root: Path,
+        manifest: Manifest,
+    ) -> list[tuple[float, float]] | None:
+        """Speech ranges on the output timeline, or None without a transcript."""
+        from podagent.mixing.timeline import speech_in_record_time
+
+        transcript_path = project_root / manifest.files.transcript
+        if not transcript_path.exists():
+            return None
+        transcript = Transcript(**read_json(transcript_path))
+        return speech_in_record_time(regions, transcript.segments)
+
+    def _assemble_single_pass(
+        self,
+        regions: list[AudioRegion],
+        project_root: Path,
+        tmp_dir: Path,
+        config: MixingConfig,
+    ) -> tuple[Path, dict[str, list[dict]], int] | None:
+        """Trim, concatenate and process all regions in one FFmpeg pass.
+
+        Only applies when every region comes from the same source track,
+        crossfades are disabled (crossfade_duration_ms=0; the default config
+        crossfades) and the processing chain is FFmpeg-only. The chain runs on
+        each region separately, as in _assemble_regions. Returns None
+        otherwise, or if FFmpeg rejects the combined graph.
+        """
+        from podagent.mixing.processing import build_filter_chain
+
+        track_paths = {r.track_path for r in regions}
+        if config.crossfade_duration_ms > 0 or len(track_paths) != 1 or "" in track_paths:
+            return None
+
+        processing_log: dict[str, list[dict]] = {}
+        audio_filter = None
+        if config.noise_reduction_provider != "none" or config.compression_enabled:
+            chain = build_filter_chain(config)
+            if chain is None:
+                return None
+            audio_filter, steps = chain
+            processing_log[regions[0].track_path] = steps
+
+        track_path = project_root / regions[0].track_path
+        cuts = []
+        for region in regions:
+            start = max(region.source_start + region.offset_ms / 1000.0, 0.0)
+            cuts.append((start, start + region.duration))
+
+        log_step("Extract", f"Extracting and processing {len(cuts)} regions in one pass...")
+        assembled_path = tmp_dir / "assembled.wav"
+        try:
+            extract_and_filter(
+                track_path,
+                assembled_path,
+                cuts,
+                audio_filter or None,
+                sample_rate=config.output_sample_rate,
+            )
+        except FFmpegError as e:
+            log_warning(f"Single-pass assembly failed, extracting regions separately: {e}")
+            return None
+        return assembled_path, processing_log, 0
+
+    def _assemble_regions(
+        self,
+        regions: list[AudioRegion],
+        project_root: Path,
+        tmp_dir: Path,
+        manifest: Manifest,
+    ) -> tuple[Path, dict[str, list[dict]], int]:
+        """Extract each region, process it, then join with crossfades."""
+        config = manifest.config.mixing
+
+        # Step 2: Extract audio regions
+        from podagent.mixing.extract import extract_regions
+
+        extracted = extract_regions(
+            regions,
+            project_root,
+            tmp_dir,
+            sample_rate=config.output_sample_rate,
+        )
+        manifest.get_stage("mixing").last_completed_step = "extract"
+
+        # Step 3: Per-track processing
+        processing_log: dict[str, list[dict]] = {}
+
+        if config.noise_reduction_provider != "none" or config.compression_enabled:
+            from podagent.mixing.processing import process_region
+
+            log_step("Processing", f"Applying audio processing ({len(extracted)} regions)...")
+
+            for edit_id, region_path in extracted.items():
+                processed_path = tmp_dir / f"{region_path.stem}_processed{region_path.suffix}"
+                steps = process_region(region_path, processed_path, config)
+                extracted[edit_id] = processed_path
+                # Group by track for logging
+                region = next((r for r in regions if r.edit_id == edit_id), None)
+                track_key = region.track_path if region else "unknown"
+                if track_key not in processing_log:
+                    processing_log[track_key] = steps
+        manifest.get_stage("mixing").last_completed_step = "processing"
+
+        # Step 4: Assemble with crossfades
+        from podagent.mixing.crossfade import apply_crossfade, concatenate_all
+
+        ordered_paths = []
+        for region in regions:
+            if region.edit_id in extracted:
+                ordered_paths.append(extracted[region.edit_id])
+
+        if config.crossfade_duration_ms > 0 and len(ordered_paths) > 1:
+            log_step("Crossfade", f"Applying crossfades ({len(ordered_paths) - 1} edit points)...")
+            # Apply crossfades sequentially
+            current = ordered_paths[0]
+            crossfade_count = 0
+            for i in range(1, len(ordered_paths)):
+                output = tmp_dir / f"xfade_{i:04d}.wav"
+                apply_crossfade(
+                    current,
+                    ordered_paths[i],
+                    output,
+                    duration_ms=config.crossfade_duration_ms,
+                    curve=config.crossfade_curve,
+                )
+                current = output
+                crossfade_count += 1
+            assembled_path = current
+        else:
+            assembled_path = tmp_dir / "assembled.wav"
+            concatenate_all(ordered_paths, assembled_path)
+            crossfade_count = 0
+
+        return assembled_path, processing_log, crossfade_count
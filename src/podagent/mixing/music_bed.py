@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from podagent.utils.ffmpeg import run_ffmpeg
+from podagent.utils.ffmpeg import INTERMEDIATE_CODEC, run_ffmpeg
 from podagent.utils.progress import log_step
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def mix_intro_music(
     speech_path: Path,
@@ -42,11 +46,120 @@ def mix_intro_music(
         "-i", str(speech_path),
         "-i", str(music_path),
         "-filter_complex", filter_complex,
-        "-c:a", "pcm_s24le",
+        "-c:a", INTERMEDIATE_CODEC,
         str(output_path),
     ])
 
 
+# Frames per block when copying the speech past the end of the intro music
+_COPY_BLOCK_FRAMES = 1 << 16
+
+
+def mix_intro_music_numpy(
+    speech_path: Path,
+    music_path: Path,
+    output_path: Path,
+    speech_regions: list[tuple[float, float]],
+    *,
+    music_volume_db: float = -12.0,
+    duck_db: float = -12.0,
+    ramp_ms: int = 200,
+) -> None:
+    """Mix intro music under speech using a precomputed ducking envelope.
+
+    Speech positions are already known from the transcript, so instead of
+    running FFmpeg's sidechain compressor the music gain is set to duck_db
+    inside each (start, end) speech range on the output timeline (see
+    timeline.speech_in_record_time), smoothed over ramp_ms, and applied in a
+    single vectorized pass. Between ranges the music returns to full level.
+
+    Only the music-length prefix of the speech is loaded and mixed; the rest
+    of the episode is copied through in blocks.
+
+    Raises ImportError if numpy/soundfile/scipy are missing, ValueError if
+    the two files differ in sample rate, and RuntimeError
+    (soundfile.LibsndfileError) if either file can't be read; callers fall
+    back to mix_intro_music.
+    """
+    if not music_path.exists():
+        raise FileNotFoundError(f"Intro music not found: {music_path}")
+
+    import numpy as np
+    import soundfile as sf
+
+    log_step("Music", f"Mixing intro music ({music_path.name}, precomputed ducking)")
+
+    music, music_sr = sf.read(str(music_path), dtype="float32", always_2d=True)
+
+    with sf.SoundFile(str(speech_path)) as speech_file:
+        sr = speech_file.samplerate
+        channels = speech_file.channels
+        if music_sr != sr:
+            raise ValueError(
+                f"Intro music sample rate ({music_sr}Hz) differs from speech ({sr}Hz)"
+            )
+
+        # Match music channel layout to speech
+        if music.shape[1] != channels:
+            mono = music.mean(axis=1, keepdims=True)
+            music = np.repeat(mono, channels, axis=1)
+
+        # Output length follows speech (same as amix duration=first)
+        head = speech_file.read(music.shape[0], dtype="float32", always_2d=True)
+        n_music = head.shape[0]
+        music = music[:n_music]
+
+        envelope = _ducking_envelope(
+            n_music,
+            sr,
+            speech_regions,
+            duck_db=duck_db,
+            ramp_ms=ramp_ms,
+        )
+        envelope *= np.float32(10 ** (music_volume_db / 20))
+
+        head += music * envelope[:, None]
+
+        with sf.SoundFile(
+            str(output_path),
+            mode="w",
+            samplerate=sr,
+            channels=channels,
+            subtype="FLOAT",
+        ) as out:
+            out.write(head)
+            for block in speech_file.blocks(_COPY_BLOCK_FRAMES, dtype="float32"):
+                out.write(block)
+
+
+def _ducking_envelope(
+    n: int,
+    sample_rate: int,
+    speech_regions: list[tuple[float, float]],
+    *,
+    duck_db: float,
+    ramp_ms: int,
+) -> np.ndarray:
+    """Per-sample music gain: duck_db inside speech, unity elsewhere.
+
+    speech_regions are (start, end) seconds on the output timeline; the
+    steps between levels are smoothed with a ramp_ms moving average.
+    """
+    import numpy as np
+    from scipy.ndimage import uniform_filter1d
+
+    envelope = np.ones(n, dtype=np.float32)
+    duck_gain = np.float32(10 ** (duck_db / 20))
+    for start, end in speech_regions:
+        lo = max(int(start * sample_rate), 0)
+        hi = min(int(end * sample_rate), n)
+        if lo < hi:
+            envelope[lo:hi] = duck_gain
+
+    ramp = max(int(sample_rate * ramp_ms / 1000), 1)
+    return uniform_filter1d(envelope, size=ramp, mode="nearest")
+
+
 def mix_outro_music(
     speech_path: Path,
     music_path: Path,
@@ -67,6 +180,6 @@ def mix_outro_music(
         "-filter_complex",
         f"[1:a]volume={music_volume_db}dB[music];"
         f"[0:a][music]concat=n=2:v=0:a=1",
-        "-c:a", "pcm_s24le",
+        "-c:a", INTERMEDIATE_CODEC,
         str(output_path),
     ])
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 from podagent.models.config import MixingConfig
-from podagent.utils.ffmpeg import apply_filter
-from podagent.utils.progress import log_step, log_warning
+from podagent.utils.ffmpeg import INTERMEDIATE_CODEC, apply_filter
+from podagent.utils.progress import log_warning
+
+DE_ESS_FILTER = "equalizer=f=7000:t=q:w=2:g=-6"
 
 
 def process_region(
@@ -20,10 +23,11 @@ def process_region(
     """
     steps: list[dict] = []
     current_path = input_path
+    parent, stem, suffix = output_path.parent, output_path.stem, output_path.suffix
 
     # Step 1: Noise reduction
     if config.noise_reduction_provider != "none":
-        nr_output = output_path.parent / f"{output_path.stem}_nr{output_path.suffix}"
+        nr_output = parent / f"{stem}_nr{suffix}"
         try:
             _apply_noise_reduction(current_path, nr_output, config)
             steps.append({
@@ -44,32 +48,12 @@ def process_region(
 
     # Step 2: Compression
     if config.compression_enabled:
-        comp_output = output_path.parent / f"{output_path.stem}_comp{output_path.suffix}"
-        threshold = config.compression_threshold_db
-        ratio = config.compression_ratio
-        attack = config.compression_attack_ms
-        release = config.compression_release_ms
-
-        filter_str = (
-            f"acompressor=threshold={threshold}dB"
-            f":ratio={ratio}"
-            f":attack={attack}"
-            f":release={release}"
-            f":makeup=2dB"
-        )
+        comp_output = parent / f"{stem}_comp{suffix}"
+        filter_str = _compression_filter(config)
 
         try:
-            apply_filter(current_path, comp_output, filter_str)
-            steps.append({
-                "step": "compression",
-                "filter": filter_str,
-                "parameters": {
-                    "threshold_db": threshold,
-                    "ratio": f"{ratio}:1",
-                    "attack_ms": attack,
-                    "release_ms": release,
-                },
-            })
+            apply_filter(current_path, comp_output, filter_str, codec=INTERMEDIATE_CODEC)
+            steps.append(_compression_step(config, filter_str))
             current_path = comp_output
         except Exception as e:
             log_warning(f"Compression failed: {e}. Skipping.")
@@ -77,14 +61,13 @@ def process_region(
 
     # Step 3: De-essing (optional)
     if config.de_essing_enabled:
-        de_ess_output = output_path.parent / f"{output_path.stem}_deess{output_path.suffix}"
-        filter_str = "equalizer=f=7000:t=q:w=2:g=-6"
+        de_ess_output = parent / f"{stem}_deess{suffix}"
         try:
-            apply_filter(current_path, de_ess_output, filter_str)
+            apply_filter(current_path, de_ess_output, DE_ESS_FILTER, codec=INTERMEDIATE_CODEC)
             steps.append({
                 "step": "de_essing",
                 "enabled": True,
-                "filter": filter_str,
+                "filter": DE_ESS_FILTER,
             })
             current_path = de_ess_output
         except Exception as e:
@@ -95,12 +78,71 @@ def process_region(
 
     # Copy final result to output path
     if current_path != output_path:
-        import shutil
         shutil.copy2(current_path, output_path)
 
     return steps
 
 
+def build_filter_chain(config: MixingConfig) -> tuple[str, list[dict]] | None:
+    """Build the processing chain as one comma-separated FFmpeg filter.
+
+    Used when extraction and processing run in a single FFmpeg pass. Returns
+    the filter string (empty if nothing applies) and the step records for the
+    mixing log, or None if the chain needs a non-FFmpeg provider.
+    """
+    if config.noise_reduction_provider not in ("none", "ffmpeg"):
+        return None
+
+    filters: list[str] = []
+    steps: list[dict] = []
+
+    if config.noise_reduction_provider == "ffmpeg":
+        nr_filter = f"afftdn=nf={config.noise_floor_db}"
+        filters.append(nr_filter)
+        steps.append({
+            "step": "noise_reduction",
+            "provider": "ffmpeg",
+            "filter": nr_filter,
+            "parameters": {"noise_floor_db": config.noise_floor_db},
+        })
+
+    if config.compression_enabled:
+        filter_str = _compression_filter(config)
+        filters.append(filter_str)
+        steps.append(_compression_step(config, filter_str))
+
+    if config.de_essing_enabled:
+        filters.append(DE_ESS_FILTER)
+        steps.append({"step": "de_essing", "enabled": True, "filter": DE_ESS_FILTER})
+    else:
+        steps.append({"step": "de_essing", "enabled": False})
+
+    return ",".join(filters), steps
+
+
+def _compression_filter(config: MixingConfig) -> str:
+    return (
+        f"acompressor=threshold={config.compression_threshold_db}dB"
+        f":ratio={config.compression_ratio}"
+        f":attack={config.compression_attack_ms}"
+        f":release={config.compression_release_ms}"
+        f":makeup=2dB"
+    )
+
+
+def _compression_step(config: MixingConfig, filter_str: str) -> dict:
+    return {
+        "step": "compression",
+        "filter": filter_str,
+        "parameters": {
+            "threshold_db": config.compression_threshold_db,
+            "ratio": f"{config.compression_ratio}:1",
+            "attack_ms": config.compression_attack_ms,
+            "release_ms": config.compression_release_ms,
+        },
+    }
+
+
 def _apply_noise_reduction(
     input_path: Path,
     output_path: Path,
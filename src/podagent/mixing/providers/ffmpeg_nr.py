@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from podagent.utils.ffmpeg import apply_filter
+from podagent.utils.ffmpeg import INTERMEDIATE_CODEC, apply_filter
 
 
 class FFmpegNoiseReduction:
@@ -21,4 +21,5 @@ class FFmpegNoiseReduction:
             input_path,
             output_path,
             f"afftdn=nf={noise_floor_db}",
+            codec=INTERMEDIATE_CODEC,
         )
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from podagent.models.alignment import AlignmentMap
 from podagent.models.edl import EDLSidecar, Edit
+from podagent.models.transcript import Segment
 from podagent.utils.progress import log_step
 
 
@@ -63,3 +64,27 @@ def build_timeline(
 
     log_step("Timeline", f"Built timeline: {len(regions)} regions")
     return regions
+
+
+def speech_in_record_time(
+    regions: list[AudioRegion],
+    segments: list[Segment],
+) -> list[tuple[float, float]]:
+    """Map transcript speech segments onto the output (record) timeline.
+
+    Each region plays source_start..source_end at record_start, so the part
+    of every segment that falls inside a region is shifted by the same
+    amount. Pauses between segments stay outside every returned range.
+    """
+    spans = sorted((s.start, s.end) for s in segments)
+    speech: list[tuple[float, float]] = []
+    for region in regions:
+        shift = region.record_start - region.source_start
+        for start, end in spans:
+            if start >= region.source_end:
+                break
+            lo = max(start, region.source_start)
+            hi = min(end, region.source_end)
+            if lo < hi:
+                speech.append((lo + shift, hi + shift))
+    return speech
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    field_serializer,
+)
 
 from podagent.models.config import (
     EditingConfig,
@@ -86,6 +94,23 @@ class StageStatus(BaseModel):
     last_completed_step: str | None = None
     artifact_checksums: dict[str, str] = Field(default_factory=dict)
 
+    # The msgpack checkpoint stores epoch seconds (dump with
+    # context={"checkpoint": True}); manifest.yaml keeps ISO-8601 strings.
+    # Both parse back into datetimes on load.
+    @field_serializer(
+        "started_at", "completed_at", "gate_approved_at",
+        mode="wrap", when_used="json",
+    )
+    def _serialize_timestamp(
+        self,
+        value: datetime | None,
+        handler: SerializerFunctionWrapHandler,
+        info: SerializationInfo,
+    ) -> float | str | None:
+        if value is not None and info.context and info.context.get("checkpoint"):
+            return value.timestamp()
+        return handler(value)
+
 
 class Pipeline(BaseModel):
     """Pipeline execution state."""
@@ -119,8 +144,89 @@ class Manifest(BaseModel):
     pipeline: Pipeline = Field(default_factory=Pipeline)
     config: Config = Field(default_factory=Config)
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Manifest:
+        """Build a Manifest from data we wrote ourselves, skipping validation.
+
+        Uses model_construct on every nested model. Only use this for
+        manifests written by the pipeline; user-supplied data must go through
+        normal validation.
+        """
+        data = dict(data)
+
+        project = dict(data["project"])
+        project["participants"] = [
+            Participant.model_construct(**p) for p in project.get("participants", [])
+        ]
+        data["project"] = Project.model_construct(**project)
+
+        if "files" in data:
+            files = dict(data["files"])
+            files["source_tracks"] = [
+                SourceTrack.model_construct(**t) for t in files.get("source_tracks", [])
+            ]
+            data["files"] = Files.model_construct(**files)
+
+        if "pipeline" in data:
+            pipeline = dict(data["pipeline"])
+            if "stages" in pipeline:
+                pipeline["stages"] = {
+                    name: _construct_stage(stage)
+                    for name, stage in pipeline["stages"].items()
+                }
+            data["pipeline"] = Pipeline.model_construct(**pipeline)
+
+        if "config" in data:
+            config = dict(data["config"])
+            for key, config_cls in (
+                ("ingestion", IngestionConfig),
+                ("editing", EditingConfig),
+                ("mixing", MixingConfig),
+                ("mastering", MasteringConfig),
+            ):
+                if key in config:
+                    config[key] = config_cls.model_construct(**config[key])
+            data["config"] = Config.model_construct(**config)
+
+        return cls.model_construct(**data)
+
     def get_stage(self, name: str) -> StageStatus:
         return self.pipeline.stages[name]
 
     def project_root(self, manifest_path: Path) -> Path:
         return manifest_path.parent
+
+
+# Built once at import; reused by every manifest load/save
+MANIFEST_ADAPTER = TypeAdapter(Manifest)
+
+
+def load_manifest_data(data: dict[str, Any]) -> Manifest:
+    """Validate raw manifest data into a Manifest."""
+    return MANIFEST_ADAPTER.validate_python(data)
+
+
+def dump_manifest(manifest: Manifest) -> dict[str, Any]:
+    """Dump a Manifest to JSON-compatible data for YAML/JSON output."""
+    return MANIFEST_ADAPTER.dump_python(manifest, mode="json")
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    # Python < 3.11 fromisoformat does not accept a trailing "Z"
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _construct_stage(data: dict[str, Any]) -> StageStatus:
+    stage = dict(data)
+    for key in ("started_at", "completed_at", "gate_approved_at"):
+        if key in stage:
+            stage[key] = _parse_datetime(stage[key])
+    if stage.get("error") is not None:
+        stage["error"] = StageError.model_construct(**stage["error"])
+    return StageStatus.model_construct(**stage)
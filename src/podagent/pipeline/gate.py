@@ -6,22 +6,89 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
-import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from pydantic import BaseModel, Field, TypeAdapter
 
-from podagent.models.manifest import Manifest
-from podagent.utils.io import read_yaml, write_yaml
+from podagent.models.alignment import AlignmentMap
+from podagent.models.context import ContextDocument
+from podagent.models.manifest import Manifest, dump_manifest
+from podagent.utils.io import write_yaml
 from podagent.utils.progress import log, log_success
 
-console = Console()
+# rich and click are imported inside the functions that render, so loading
+# this module (e.g. for `podagent gate approve`) stays cheap.
+_console = None
+
+
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Projections of the transcript and EDL holding only the fields the gates
+# display. Undeclared fields (word timings, rationale text, ...) are skipped
+# during validation instead of being built into full model objects.
+
+
+class _SpeakerOnly(BaseModel):
+    speaker: str = "?"
+
+
+class _WordCountOnly(BaseModel):
+    word_count: int | None = None
+
+
+class _TranscriptSummary(BaseModel):
+    duration_seconds: float = 0.0
+    language: str | None = None
+    segments: list[_SpeakerOnly] = Field(default_factory=list)
+    metadata: _WordCountOnly = Field(default_factory=_WordCountOnly)
+
+
+class _EditSummary(BaseModel):
+    type: str
+    review_flag: str | None = None
+
+
+class _EDLSummary(BaseModel):
+    original_duration_seconds: float = 0.0
+    edited_duration_seconds: float = 0.0
+    time_removed_seconds: float = 0.0
+    time_removed_percent: float = 0.0
+    edits: list[_EditSummary] = Field(default_factory=list)
+
+
+_TRANSCRIPT_SUMMARY = TypeAdapter(_TranscriptSummary)
+_EDL_SUMMARY = TypeAdapter(_EDLSummary)
+
+
+def _print_metrics(title: str, rows: list[tuple[str, str]]) -> None:
+    """Print a two-column Metric/Value summary table."""
+    from rich.table import Table
+
+    table = Table(title=title, show_lines=True)
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    for metric, value in rows:
+        table.add_row(metric, value)
+    _get_console().print(table)
 
 
 def present_gate(
     project_root: Path, manifest: Manifest, stage_name: str
 ) -> bool:
     """Present a review gate to the user. Returns True if approved."""
+    import click
+
+    console = _get_console()
     console.print()
     console.print(f"[bold yellow]═══ Gate Review: {stage_name} ═══[/bold yellow]")
     console.print()
@@ -41,56 +108,51 @@ def present_gate(
 
 def _show_ingestion_gate(project_root: Path, manifest: Manifest) -> None:
     """Show ingestion gate review information."""
+    console = _get_console()
     transcript_path = project_root / manifest.files.transcript
     alignment_path = project_root / manifest.files.alignment_map
     context_path = project_root / manifest.files.context_document
 
     # Transcript summary
     if transcript_path.exists():
-        with open(transcript_path) as f:
-            transcript = json.load(f)
-        segments = transcript.get("segments", [])
-        meta = transcript.get("metadata", {})
-        speakers = sorted(set(s.get("speaker", "?") for s in segments))
-
-        table = Table(title="Transcript Summary", show_lines=True)
-        table.add_column("Metric", style="bold")
-        table.add_column("Value")
-        table.add_row("Segments", str(len(segments)))
-        table.add_row("Words", str(meta.get("word_count", "?")))
-        table.add_row("Duration", f"{transcript.get('duration_seconds', 0):.0f}s")
-        table.add_row("Speakers", ", ".join(speakers))
-        table.add_row("Language", transcript.get("language", "?"))
-        console.print(table)
+        transcript = _TRANSCRIPT_SUMMARY.validate_json(transcript_path.read_bytes())
+        segments = transcript.segments
+        speakers = sorted(set(s.speaker for s in segments))
+        word_count = transcript.metadata.word_count
+
+        _print_metrics("Transcript Summary", [
+            ("Segments", str(len(segments))),
+            ("Words", str(word_count if word_count is not None else "?")),
+            ("Duration", f"{transcript.duration_seconds:.0f}s"),
+            ("Speakers", ", ".join(speakers)),
+            ("Language", transcript.language or "?"),
+        ])
     else:
         console.print("[yellow]Transcript not found[/yellow]")
 
     # Alignment summary
     if alignment_path.exists():
-        with open(alignment_path) as f:
-            alignment = json.load(f)
-        tracks = alignment.get("tracks", [])
+        alignment = AlignmentMap.model_validate_json(alignment_path.read_bytes())
         console.print()
         console.print("[bold]Alignment:[/bold]")
-        for t in tracks:
-            conf = t.get("alignment_confidence")
+        for t in alignment.tracks:
+            conf = t.alignment_confidence
             conf_str = f" (confidence: {conf:.3f})" if conf is not None else ""
             console.print(
-                f"  {Path(t['path']).name}: offset {t['offset_ms']:.0f}ms{conf_str}"
+                f"  {Path(t.path).name}: offset {t.offset_ms:.0f}ms{conf_str}"
             )
 
     # Context summary
     if context_path.exists():
-        with open(context_path) as f:
-            context = json.load(f)
-        topics = context.get("topics", [])
-        nouns = context.get("proper_nouns", [])
+        context = ContextDocument.model_validate_json(context_path.read_bytes())
+        topics = context.topics
+        nouns = context.proper_nouns
         console.print()
         console.print("[bold]Context:[/bold]")
-        console.print(f"  Summary: {context.get('episode_summary', 'N/A')[:200]}")
+        console.print(f"  Summary: {(context.episode_summary or 'N/A')[:200]}")
         console.print(f"  Topics: {len(topics)}")
         for t in topics[:5]:
-            console.print(f"    - {t['name']}")
+            console.print(f"    - {t.name}")
         console.print(f"  Proper nouns: {len(nouns)}")
 
     # Show artifact paths for manual review
@@ -107,27 +169,24 @@ def _show_ingestion_gate(project_root: Path, manifest: Manifest) -> None:
 
 def _show_editing_gate(project_root: Path, manifest: Manifest) -> None:
     """Show editing gate review information."""
+    console = _get_console()
     edl_path = project_root / manifest.files.edl_sidecar
     rationale_path = project_root / manifest.files.edit_rationale
     summary_path = project_root / manifest.files.content_summary
 
     if edl_path.exists():
-        with open(edl_path) as f:
-            edl = json.load(f)
-
-        table = Table(title="Edit Summary", show_lines=True)
-        table.add_column("Metric", style="bold")
-        table.add_column("Value")
-        table.add_row("Original duration", f"{edl.get('original_duration_seconds', 0):.0f}s")
-        table.add_row("Edited duration", f"{edl.get('edited_duration_seconds', 0):.0f}s")
-        table.add_row("Time removed", f"{edl.get('time_removed_seconds', 0):.0f}s ({edl.get('time_removed_percent', 0):.1f}%)")
-        table.add_row("Total edits", str(len(edl.get("edits", []))))
-        console.print(table)
+        edl = _EDL_SUMMARY.validate_json(edl_path.read_bytes())
+
+        _print_metrics("Edit Summary", [
+            ("Original duration", f"{edl.original_duration_seconds:.0f}s"),
+            ("Edited duration", f"{edl.edited_duration_seconds:.0f}s"),
+            ("Time removed", f"{edl.time_removed_seconds:.0f}s ({edl.time_removed_percent:.1f}%)"),
+            ("Total edits", str(len(edl.edits))),
+        ])
 
         # Edit breakdown by type
-        edits = edl.get("edits", [])
-        cuts = [e for e in edits if e.get("type") == "cut"]
-        flagged = [e for e in cuts if e.get("review_flag")]
+        cuts = [e for e in edl.edits if e.type == "cut"]
+        flagged = [e for e in cuts if e.review_flag]
         console.print(f"\n  Cuts: {len(cuts)} ({len(flagged)} flagged for review)")
 
     if rationale_path.exists():
@@ -156,6 +215,7 @@ def _show_editing_gate(project_root: Path, manifest: Manifest) -> None:
 
 def _show_mixing_gate(project_root: Path, manifest: Manifest) -> None:
     """Show mixing gate review information."""
+    console = _get_console()
     mixed_path = project_root / manifest.files.mixed_audio
     log_path = project_root / manifest.files.mixing_log
     waveform_path = project_root / manifest.files.waveform
@@ -164,16 +224,14 @@ def _show_mixing_gate(project_root: Path, manifest: Manifest) -> None:
         with open(log_path) as f:
             mix_log = json.load(f)
 
-        table = Table(title="Mix Summary", show_lines=True)
-        table.add_column("Metric", style="bold")
-        table.add_column("Value")
-        table.add_row("Output duration", f"{mix_log.get('output_duration_seconds', 0):.0f}s")
-        table.add_row("Sample rate", f"{mix_log.get('output_sample_rate', 0)} Hz")
-        table.add_row("Bit depth", f"{mix_log.get('output_bit_depth', 0)}-bit")
-        table.add_row("EDL events", str(mix_log.get("edl_events_applied", 0)))
-        table.add_row("Crossfades", str(mix_log.get("crossfades_applied", 0)))
-        table.add_row("Ducking regions", str(mix_log.get("ducking_regions", 0)))
-        console.print(table)
+        _print_metrics("Mix Summary", [
+            ("Output duration", f"{mix_log.get('output_duration_seconds', 0):.0f}s"),
+            ("Sample rate", f"{mix_log.get('output_sample_rate', 0)} Hz"),
+            ("Bit depth", f"{mix_log.get('output_bit_depth', 0)}-bit"),
+            ("EDL events", str(mix_log.get("edl_events_applied", 0))),
+            ("Crossfades", str(mix_log.get("crossfades_applied", 0))),
+            ("Ducking regions", str(mix_log.get("ducking_regions", 0))),
+        ])
 
     console.print()
     console.print("[dim]Review artifacts:[/dim]")
@@ -188,6 +246,7 @@ def _show_mixing_gate(project_root: Path, manifest: Manifest) -> None:
 
 def _show_mastering_gate(project_root: Path, manifest: Manifest) -> None:
     """Show mastering gate review information."""
+    console = _get_console()
     mp3_path = project_root / manifest.files.mastered_mp3
     wav_path = project_root / manifest.files.mastered_wav
     meta_path = project_root / manifest.files.metadata_json
@@ -198,15 +257,13 @@ def _show_mastering_gate(project_root: Path, manifest: Manifest) -> None:
         loudness = meta.get("loudness", {})
         file_info = meta.get("file_info", {})
 
-        table = Table(title="Mastering Summary", show_lines=True)
-        table.add_column("Metric", style="bold")
-        table.add_column("Value")
-        table.add_row("Integrated LUFS", f"{loudness.get('integrated_lufs', '?')}")
-        table.add_row("True peak", f"{loudness.get('true_peak_dbtp', '?')} dBTP")
-        table.add_row("LRA", f"{loudness.get('loudness_range_lu', '?')} LU")
-        table.add_row("MP3 size", f"{file_info.get('mp3_size_bytes', 0) / 1_000_000:.1f} MB")
-        table.add_row("Duration", f"{file_info.get('mp3_duration_seconds', 0):.0f}s")
-        console.print(table)
+        _print_metrics("Mastering Summary", [
+            ("Integrated LUFS", f"{loudness.get('integrated_lufs', '?')}"),
+            ("True peak", f"{loudness.get('true_peak_dbtp', '?')} dBTP"),
+            ("LRA", f"{loudness.get('loudness_range_lu', '?')} LU"),
+            ("MP3 size", f"{file_info.get('mp3_size_bytes', 0) / 1_000_000:.1f} MB"),
+            ("Duration", f"{file_info.get('mp3_duration_seconds', 0):.0f}s"),
+        ])
 
     console.print()
     console.print("[dim]Review artifacts:[/dim]")
@@ -221,8 +278,10 @@ def _show_mastering_gate(project_root: Path, manifest: Manifest) -> None:
 
 def show_gate_status(manifest_path: Path) -> None:
     """Show current gate status."""
-    data = read_yaml(manifest_path)
-    manifest = Manifest(**data)
+    from podagent.pipeline.orchestrator import load_manifest
+
+    console = _get_console()
+    manifest = load_manifest(manifest_path, validate=False)
 
     for stage_name in ["ingestion", "editing", "mixing", "mastering"]:
         stage = manifest.get_stage(stage_name)
@@ -236,8 +295,9 @@ def show_gate_status(manifest_path: Path) -> None:
 
 def approve_gate(manifest_path: Path, *, notes: str | None = None) -> None:
     """Approve the current pending gate."""
-    data = read_yaml(manifest_path)
-    manifest = Manifest(**data)
+    from podagent.pipeline.orchestrator import load_manifest
+
+    manifest = load_manifest(manifest_path, validate=False)
 
     for stage_name in ["ingestion", "editing", "mixing", "mastering"]:
         stage = manifest.get_stage(stage_name)
@@ -251,7 +311,7 @@ def approve_gate(manifest_path: Path, *, notes: str | None = None) -> None:
             from podagent.pipeline.orchestrator import _next_stage
             manifest.pipeline.current_stage = _next_stage(stage_name)
 
-            write_yaml(manifest_path, manifest.model_dump(mode="json"))
+            write_yaml(manifest_path, dump_manifest(manifest))
             log_success(f"Approved gate: {stage_name}")
             return
 
@@ -260,8 +320,9 @@ def approve_gate(manifest_path: Path, *, notes: str | None = None) -> None:
 
 def reject_gate(manifest_path: Path, *, notes: str | None = None) -> None:
     """Reject the current pending gate, resetting the stage for re-run."""
-    data = read_yaml(manifest_path)
-    manifest = Manifest(**data)
+    from podagent.pipeline.orchestrator import load_manifest
+
+    manifest = load_manifest(manifest_path, validate=False)
 
     for stage_name in ["ingestion", "editing", "mixing", "mastering"]:
         stage = manifest.get_stage(stage_name)
@@ -274,7 +335,7 @@ def reject_gate(manifest_path: Path, *, notes: str | None = None) -> None:
                 stage.gate_notes = notes
             manifest.pipeline.current_stage = stage_name
 
-            write_yaml(manifest_path, manifest.model_dump(mode="json"))
+            write_yaml(manifest_path, dump_manifest(manifest))
             log(f"Gate rejected: {stage_name}. Stage reset to pending.")
             return
 
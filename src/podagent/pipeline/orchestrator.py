@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 from typing import Protocol
 
-from podagent.models.manifest import Manifest, StageError
-from podagent.utils.io import read_yaml, write_yaml
+from podagent.models.manifest import (
+    Manifest,
+    StageError,
+    dump_manifest,
+    load_manifest_data,
+)
+from podagent.utils.io import read_msgpack, read_yaml, write_msgpack, write_yaml
 from podagent.utils.progress import log, log_error, log_step, log_success, log_warning
 
-
 STAGE_ORDER = ["ingestion", "editing", "mixing", "mastering"]
+_STAGE_IDX = {name: i for i, name in enumerate(STAGE_ORDER)}
 
 
 class ModuleInterface(Protocol):
@@ -23,8 +29,13 @@ class ModuleInterface(Protocol):
     def validate_inputs(self, project_root: Path, manifest: Manifest) -> list[str]: ...
 
 
+@cache
 def _load_module(stage_name: str) -> ModuleInterface:
-    """Dynamically load a pipeline module."""
+    """Dynamically load a pipeline module.
+
+    Modules are stateless, so each one is imported and instantiated once per
+    process and reused on resume.
+    """
     if stage_name == "ingestion":
         from podagent.ingestion.module import IngestionModule
         return IngestionModule()
@@ -41,15 +52,55 @@ def _load_module(stage_name: str) -> ModuleInterface:
         raise ValueError(f"Unknown stage: {stage_name}")
 
 
-def _load_manifest(manifest_path: Path) -> Manifest:
-    """Load and validate the manifest."""
-    data = read_yaml(manifest_path)
-    return Manifest(**data)
+def _checkpoint_path(manifest_path: Path) -> Path:
+    return manifest_path.with_suffix(".checkpoint.msgpack")
+
+
+def _read_checkpoint(manifest_path: Path) -> dict | None:
+    """Return checkpoint data left by an interrupted run, if newer than the YAML."""
+    checkpoint = _checkpoint_path(manifest_path)
+    try:
+        if checkpoint.stat().st_mtime_ns > manifest_path.stat().st_mtime_ns:
+            return read_msgpack(checkpoint)
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def load_manifest(manifest_path: Path, *, validate: bool = True) -> Manifest:
+    """Load the manifest, preferring a checkpoint left by an interrupted run.
+
+    manifest.yaml may have been edited by hand, so it is always validated.
+    With validate=False a checkpoint, which only the pipeline writes, is
+    built without validation.
+    """
+    data = _read_checkpoint(manifest_path)
+    if data is not None and not validate:
+        return Manifest.from_trusted(data)
+    if data is None:
+        data = read_yaml(manifest_path)
+    return load_manifest_data(data)
+
 
+def _save_manifest(manifest_path: Path, manifest: Manifest, *, final: bool = False) -> None:
+    """Save the manifest atomically.
 
-def _save_manifest(manifest_path: Path, manifest: Manifest) -> None:
-    """Save the manifest atomically."""
-    write_yaml(manifest_path, manifest.model_dump(mode="json"))
+    Intermediate saves go to a MessagePack checkpoint next to the manifest,
+    leaving out default-valued fields (from_trusted fills them back in).
+    The final save rewrites manifest.yaml once in full and removes the
+    checkpoint.
+    """
+    checkpoint = _checkpoint_path(manifest_path)
+    if final:
+        write_yaml(manifest_path, dump_manifest(manifest), durable=True)
+        checkpoint.unlink(missing_ok=True)
+    else:
+        write_msgpack(
+            checkpoint,
+            manifest.model_dump(
+                mode="json", exclude_defaults=True, context={"checkpoint": True}
+            ),
+        )
 
 
 def run_pipeline(manifest_path: Path, *, from_stage: str | None = None) -> None:
@@ -63,7 +114,7 @@ def run_pipeline(manifest_path: Path, *, from_stage: str | None = None) -> None:
        - failed/in_progress → re-run
        - pending → run
     """
-    manifest = _load_manifest(manifest_path)
+    manifest = load_manifest(manifest_path)
     project_root = manifest_path.parent
 
     log(f"[bold]PodAgent OS[/bold] — {manifest.project.title}")
@@ -72,12 +123,26 @@ def run_pipeline(manifest_path: Path, *, from_stage: str | None = None) -> None:
     # Determine starting stage
     start_idx = 0
     if from_stage:
-        if from_stage not in STAGE_ORDER:
+        if from_stage not in _STAGE_IDX:
             raise ValueError(f"Unknown stage: {from_stage}")
-        start_idx = STAGE_ORDER.index(from_stage)
+        start_idx = _STAGE_IDX[from_stage]
         log(f"Resuming from: [cyan]{from_stage}[/cyan]")
 
-    for stage_name in STAGE_ORDER[start_idx:]:
+    # Stages checkpoint to MessagePack as they go; manifest.yaml is written
+    # once on every exit path (completion, gate pause, or failure). Gate
+    # approvals are not checkpointed on their own: the next stage's
+    # in_progress save or the final save carries them.
+    try:
+        _run_stages(manifest_path, manifest, STAGE_ORDER[start_idx:])
+    finally:
+        _save_manifest(manifest_path, manifest, final=True)
+
+
+def _run_stages(manifest_path: Path, manifest: Manifest, stages: list[str]) -> None:
+    """Run each stage in turn, checkpointing the manifest between steps."""
+    project_root = manifest_path.parent
+
+    for stage_name in stages:
         stage = manifest.get_stage(stage_name)
 
         # Skip completed + approved stages
@@ -95,12 +160,10 @@ def run_pipeline(manifest_path: Path, *, from_stage: str | None = None) -> None:
                 stage.gate_approved = True
                 stage.gate_approved_at = datetime.now(timezone.utc)
                 manifest.pipeline.current_stage = _next_stage(stage_name)
-                _save_manifest(manifest_path, manifest)
                 log_success(f"Gate approved for {stage_name}")
                 continue
             else:
                 log_warning(f"Gate not approved for {stage_name}. Pipeline paused.")
-                _save_manifest(manifest_path, manifest)
                 return
 
         # Run the stage
@@ -132,7 +195,6 @@ def run_pipeline(manifest_path: Path, *, from_stage: str | None = None) -> None:
                 message=str(e)[:500],
                 step=stage.last_completed_step,
             )
-            _save_manifest(manifest_path, manifest)
             log_error(f"{stage_name} failed: {e}")
             raise
 
@@ -152,10 +214,8 @@ def run_pipeline(manifest_path: Path, *, from_stage: str | None = None) -> None:
             stage.gate_approved = True
             stage.gate_approved_at = datetime.now(timezone.utc)
             manifest.pipeline.current_stage = _next_stage(stage_name)
-            _save_manifest(manifest_path, manifest)
         else:
             log_warning(f"Gate not approved. Run `podagent gate approve` when ready.")
-            _save_manifest(manifest_path, manifest)
             return
 
     log_success("[bold]Pipeline complete![/bold]")
@@ -163,7 +223,7 @@ def run_pipeline(manifest_path: Path, *, from_stage: str | None = None) -> None:
 
 def _next_stage(current: str) -> str:
     """Get the next stage name, or 'complete'."""
-    idx = STAGE_ORDER.index(current)
+    idx = _STAGE_IDX[current]
     if idx + 1 < len(STAGE_ORDER):
         return STAGE_ORDER[idx + 1]
     return "complete"
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import subprocess
 from pathlib import Path
 
-from rich.console import Console
-
-console = Console(stderr=True)
+# Codec for temporary files between processing steps. Float samples avoid
+# 24-bit packing on every pass; quantize once when writing the final output.
+INTERMEDIATE_CODEC = "pcm_f32le"
 
 
 class FFmpegError(Exception):
@@ -20,15 +22,68 @@ class FFmpegError(Exception):
         super().__init__(f"FFmpeg failed (rc={returncode}): {stderr[:500]}")
 
 
+_FFMPEG_BASE = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
+
+
 def run_ffmpeg(args: list[str], *, check: bool = True) -> subprocess.CompletedProcess:
-    """Run an FFmpeg command with standard options."""
-    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    """Run an FFmpeg command with standard options.
+
+    Output always goes to a file, so stdout is discarded rather than piped.
+    stderr is captured as bytes and only decoded when building an error.
+    """
+    cmd = _FFMPEG_BASE + args
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     if check and result.returncode != 0:
-        raise FFmpegError(cmd, result.returncode, result.stderr)
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        raise FFmpegError(cmd, result.returncode, stderr)
     return result
 
 
+async def _run_ffmpeg_async(args: list[str], semaphore: asyncio.Semaphore) -> None:
+    cmd = _FFMPEG_BASE + args
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            # A sibling job failed: don't leave this FFmpeg running
+            proc.kill()
+            await proc.wait()
+            raise
+    if proc.returncode != 0:
+        raise FFmpegError(cmd, proc.returncode, stderr.decode("utf-8", errors="replace"))
+
+
+def run_ffmpeg_parallel(jobs: list[list[str]], *, max_workers: int | None = None) -> None:
+    """Run independent FFmpeg commands concurrently.
+
+    At most max_workers processes (default: CPU count) run at once. The
+    commands must write disjoint outputs. Raises FFmpegError for the first
+    failure, after killing the jobs still running and dropping queued ones.
+    """
+    if len(jobs) <= 1:
+        for args in jobs:
+            run_ffmpeg(args)
+        return
+
+    async def _gather() -> None:
+        semaphore = asyncio.Semaphore(max_workers or os.cpu_count() or 1)
+        tasks = [asyncio.ensure_future(_run_ffmpeg_async(args, semaphore)) for args in jobs]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    asyncio.run(_gather())
+
+
 def resample(
     input_path: Path | str,
     output_path: Path | str,
@@ -44,22 +99,80 @@ def resample(
     ])
 
 
-def extract_region(
+def build_extract_batches(
+    input_path: Path | str,
+    regions: list[tuple[Path | str, float, float]],
+    *,
+    sample_rate: int = 48000,
+    channels: int = 1,
+    codec: str = INTERMEDIATE_CODEC,
+    batch_size: int = 64,
+) -> list[list[str]]:
+    """Build FFmpeg jobs extracting (output_path, start, duration) regions.
+
+    Each job decodes the input once and writes up to batch_size outputs, so
+    process startup is paid per batch rather than per region. Run the jobs
+    with run_ffmpeg_parallel.
+    """
+    # Always re-encode: with -c copy an output-side -ss/-t can only cut on
+    # packet boundaries, so the region edges would drift.
+    codec_args = ["-c:a", codec, "-ar", str(sample_rate), "-ac", str(channels)]
+
+    jobs = []
+    for i in range(0, len(regions), batch_size):
+        args = ["-i", str(input_path)]
+        for output_path, start, duration in regions[i:i + batch_size]:
+            args.extend([
+                "-map", "0:a:0",
+                "-ss", str(start),
+                "-t", str(duration),
+                *codec_args,
+                str(output_path),
+            ])
+        jobs.append(args)
+    return jobs
+
+
+def build_trim_concat_graph(
+    cuts: list[tuple[float, float]],
+    audio_filter: str | None = None,
+) -> str:
+    """Build a filter_complex that trims (start, end) cuts from input 0 and
+    concatenates them. Output is [out].
+
+    audio_filter is applied to each cut on its own before the concat, so
+    stateful filters (compressor, denoiser) start fresh at every edit point
+    exactly as when each region is extracted and processed separately.
+    """
+    n = len(cuts)
+    split_labels = "".join(f"[s{i}]" for i in range(n))
+    per_cut = f",{audio_filter}" if audio_filter else ""
+    parts = [f"[0:a]asplit={n}{split_labels}"]
+    for i, (start, end) in enumerate(cuts):
+        parts.append(
+            f"[s{i}]atrim=start={start}:end={end},asetpts=PTS-STARTPTS{per_cut}[a{i}]"
+        )
+    parts.append("".join(f"[a{i}]" for i in range(n)) + f"concat=n={n}:v=0:a=1[out]")
+    return ";".join(parts)
+
+
+def extract_and_filter(
     input_path: Path | str,
     output_path: Path | str,
-    start: float,
-    duration: float,
+    cuts: list[tuple[float, float]],
+    audio_filter: str | None = None,
     *,
     sample_rate: int = 48000,
     channels: int = 1,
-    bit_depth: int = 24,
+    codec: str = INTERMEDIATE_CODEC,
 ) -> None:
-    """Extract a time region from an audio file."""
-    codec = f"pcm_s{bit_depth}le"
+    """Extract, concatenate and filter several cuts in one FFmpeg pass."""
+    if not cuts:
+        raise ValueError("No cuts to extract")
     run_ffmpeg([
-        "-ss", str(start),
         "-i", str(input_path),
-        "-t", str(duration),
+        "-filter_complex", build_trim_concat_graph(cuts, audio_filter),
+        "-map", "[out]",
         "-c:a", codec,
         "-ar", str(sample_rate),
         "-ac", str(channels),
@@ -90,24 +203,26 @@ def apply_filter(
 def measure_loudness(input_path: Path | str) -> dict:
     """Measure loudness using the loudnorm filter (pass 1)."""
     import json
-    import re
 
     result = subprocess.run(
         [
-            "ffmpeg", "-hide_banner",
+            "ffmpeg", "-hide_banner", "-nostats",
             "-i", str(input_path),
             "-af", "loudnorm=I=-16:TP=-1:LRA=11:print_format=json",
             "-f", "null", "-",
         ],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
     )
 
-    json_match = re.search(r"\{[^}]+\}", result.stderr, re.DOTALL)
-    if not json_match:
+    # loudnorm prints its JSON block last; scan back from the end of stderr
+    stderr = result.stderr
+    end = stderr.rfind(b"}")
+    start = stderr.rfind(b"{", 0, end)
+    if end < 0 or start < 0:
         raise RuntimeError(f"Failed to parse loudnorm output from: {input_path}")
 
-    return json.loads(json_match.group())
+    return json.loads(stderr[start:end + 1])
 
 
 def generate_waveform(
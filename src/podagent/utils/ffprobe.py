@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioInfo:
-    """Audio file metadata extracted via FFprobe."""
+    """Audio file metadata extracted via FFprobe.
+
+    Frozen because probe results are cached and shared between callers.
+    """
 
     path: str
     duration_seconds: float
@@ -19,24 +24,44 @@ class AudioInfo:
     codec: str
     bit_depth: int | None
     format_name: str
+    format_short: str
+
 
-    @property
-    def format_short(self) -> str:
-        if "wav" in self.format_name:
-            return "wav"
-        if "flac" in self.format_name:
-            return "flac"
-        if "mp3" in self.format_name or self.codec == "mp3":
-            return "mp3"
-        return self.format_name
+def _format_short(format_name: str, codec: str) -> str:
+    if "wav" in format_name:
+        return "wav"
+    if "flac" in format_name:
+        return "flac"
+    if "mp3" in format_name or codec == "mp3":
+        return "mp3"
+    return format_name
 
 
 def probe_audio(path: Path | str) -> AudioInfo:
-    """Probe an audio file with FFprobe and return metadata."""
+    """Probe an audio file with FFprobe and return metadata.
+
+    Results are cached per (path, mtime, size), so re-probing an unchanged
+    file (e.g. on pipeline resume) does not spawn ffprobe again.
+    """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Audio file not found: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file not found: {path}") from None
+    return _probe_cached(str(path), st.st_mtime_ns, st.st_size)
+
 
+def probe_many(paths: list[Path] | list[str], workers: int = 8) -> list[AudioInfo]:
+    """Probe several files concurrently, returning results in input order."""
+    if len(paths) <= 1:
+        return [probe_audio(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(probe_audio, paths))
+
+
+@lru_cache(maxsize=256)
+def _probe_cached(path_str: str, mtime_ns: int, size: int) -> AudioInfo:
+    path = Path(path_str)
     result = subprocess.run(
         [
             "ffprobe",
@@ -72,12 +97,16 @@ def probe_audio(path: Path | str) -> AudioInfo:
             bit_depth = int(val)
             break
 
+    codec = audio_stream.get("codec_name", "")
+    format_name = fmt.get("format_name", "")
+
     return AudioInfo(
         path=str(path),
         duration_seconds=float(fmt.get("duration", audio_stream.get("duration", 0))),
         sample_rate=int(audio_stream.get("sample_rate", 0)),
         channels=int(audio_stream.get("channels", 0)),
-        codec=audio_stream.get("codec_name", ""),
+        codec=codec,
         bit_depth=bit_depth,
-        format_name=fmt.get("format_name", ""),
+        format_name=format_name,
+        format_short=_format_short(format_name, codec),
     )
@@ -1,58 +1,238 @@
-"""File I/O utilities — atomic writes, YAML handling."""
+"""File I/O utilities — atomic writes, YAML, JSON and MessagePack handling."""
 
 from __future__ import annotations
 
 import hashlib
-import json
-import tempfile
+import io
+import mmap
+import os
+import re
+import secrets
+from collections import defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-from ruamel.yaml import YAML
+import msgspec
+import orjson
+import yaml
 
-_yaml = YAML()
-_yaml.preserve_quotes = True
-_yaml.default_flow_style = False
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YAMLDumper
+    from yaml import SafeLoader as _SafeLoader
 
 
-def write_atomic(path: Path | str, data: Any, *, as_yaml: bool = False) -> None:
-    """Write data to a file atomically (write to temp, then rename)."""
+class _YAMLLoader(_SafeLoader):
+    """Safe loader resolving plain scalars like YAML 1.2 (as ruamel does).
+
+    PyYAML follows YAML 1.1, where `no`/`on` load as booleans and `1:30` as
+    the sexagesimal int 90. Only true/false are booleans here, and ints and
+    floats are the YAML 1.2 core schema forms; anything else stays a string.
+    """
+
+
+_YAMLLoader.yaml_implicit_resolvers = {
+    first: [
+        (tag, regexp) for tag, regexp in resolvers
+        if tag not in (
+            "tag:yaml.org,2002:bool",
+            "tag:yaml.org,2002:int",
+            "tag:yaml.org,2002:float",
+            "tag:yaml.org,2002:value",
+        )
+    ]
+    for first, resolvers in _SafeLoader.yaml_implicit_resolvers.items()
+}
+_YAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:bool",
+    re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+    list("tTfF"),
+)
+_YAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:int",
+    re.compile(r"^(?:[-+]?[0-9]+|0o[0-7]+|0x[0-9a-fA-F]+)$"),
+    list("-+0123456789"),
+)
+_YAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:float",
+    re.compile(
+        r"^(?:[-+]?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)(?:[eE][-+]?[0-9]+)?"
+        r"|[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN))$"
+    ),
+    list("-+.0123456789"),
+)
+
+
+def _construct_yaml12_int(loader: _YAMLLoader, node: yaml.ScalarNode) -> int:
+    # SafeConstructor would read a leading 0 as octal and "0o17" not at all
+    value = loader.construct_scalar(node)
+    if value[:2] in ("0o", "0x"):
+        return int(value, 0)
+    return int(value, 10)
+
+
+_YAMLLoader.add_constructor("tag:yaml.org,2002:int", _construct_yaml12_int)
+
+# Round-trip ruamel loader, only for files whose comments and quoting must
+# survive. Built on first use; most commands never need it.
+_yaml = None
+
+
+def _get_yaml():
+    global _yaml
+    if _yaml is None:
+        from ruamel.yaml import YAML
+
+        _yaml = YAML()
+        _yaml.preserve_quotes = True
+        _yaml.default_flow_style = False
+    return _yaml
+
+
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _serialize(data: Any, *, as_yaml: bool) -> bytes:
+    if as_yaml:
+        return yaml.dump(
+            data,
+            Dumper=_YAMLDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        ).encode("utf-8")
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+
+
+def write_atomic(
+    path: Path | str,
+    data: Any,
+    *,
+    as_yaml: bool = False,
+    durable: bool = False,
+    if_changed: bool = False,
+) -> None:
+    """Write data to a file atomically (write to temp, then replace).
+
+    With durable=True the data and the containing directory are fsynced, so
+    the write survives a power loss. Off by default; it costs a disk flush.
+
+    With if_changed=True the write is skipped when the file already holds
+    exactly these bytes, leaving its mtime untouched so mtime-keyed caches
+    such as the checksum cache stay valid.
+    """
     path = Path(path)
+    payload = _serialize(data, as_yaml=as_yaml)
+    if if_changed and _same_contents(path, payload):
+        return
+    _write_payload(path, payload, durable=durable)
+
+
+def _same_contents(path: Path, payload: bytes) -> bool:
+    """True if path exists and holds exactly payload (size checked first)."""
+    try:
+        if os.stat(path).st_size != len(payload):
+            return False
+        view = memoryview(payload)
+        pos = 0
+        with open(path, "rb", buffering=0) as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                if view[pos:pos + len(chunk)] != chunk:
+                    return False
+                pos += len(chunk)
+        return pos == len(payload)
+    except OSError:
+        return False
+
+
+def _write_payload(path: Path, payload: bytes, *, durable: bool) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+    _create_file(tmp_path, payload, durable=durable)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if durable:
+        _fsync_dir(path.parent)
+
+
+_CREATE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _create_file(path: Path, payload: bytes, *, durable: bool) -> None:
+    """Create path exclusively and write payload with raw os.write calls.
+
+    Raises FileExistsError if path exists. A partially written file is
+    removed before the error propagates.
+    """
+    fd = os.open(path, _CREATE_FLAGS, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if durable:
+            os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
 
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        dir=path.parent,
-        suffix=path.suffix,
-        delete=False,
-    ) as tmp:
-        if as_yaml:
-            _yaml.dump(data, tmp)
-        elif isinstance(data, str):
-            tmp.write(data)
-        else:
-            json.dump(data, tmp, indent=2, default=str)
-        tmp_path = Path(tmp.name)
 
-    tmp_path.rename(path)
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry update to disk (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def read_yaml(path: Path | str) -> dict:
     """Read a YAML file and return as dict."""
-    path = Path(path)
+    with open(path, "rb") as f:
+        return dict(yaml.load(f, Loader=_YAMLLoader) or {})
+
+
+def read_yaml_preserving(path: Path | str) -> dict:
+    """Read a YAML file keeping comments and quoting for round-trip edits."""
     with open(path) as f:
-        return dict(_yaml.load(f) or {})
+        return _get_yaml().load(f) or {}
 
 
-def write_yaml(path: Path | str, data: dict) -> None:
+def write_yaml_preserving(path: Path | str, data: Any) -> None:
+    """Write data from read_yaml_preserving back atomically, keeping comments."""
+    buf = io.BytesIO()
+    _get_yaml().dump(data, buf)
+    write_atomic(path, buf.getvalue())
+
+
+def write_yaml(path: Path | str, data: dict, *, durable: bool = False) -> None:
     """Write a dict to a YAML file atomically."""
-    write_atomic(path, data, as_yaml=True)
+    write_atomic(path, data, as_yaml=True, durable=durable)
 
 
 def read_json(path: Path | str) -> dict:
     """Read a JSON file and return as dict."""
-    with open(path) as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def write_json(path: Path | str, data: Any) -> None:
@@ -60,10 +240,85 @@ def write_json(path: Path | str, data: Any) -> None:
     write_atomic(path, data)
 
 
-def file_checksum(path: Path | str) -> str:
-    """Compute SHA-256 checksum of a file."""
-    h = hashlib.sha256()
+def read_msgpack(path: Path | str) -> Any:
+    """Read a MessagePack file."""
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+        return msgspec.msgpack.decode(f.read())
+
+
+def write_msgpack(path: Path | str, data: Any) -> None:
+    """Write data to a MessagePack file atomically.
+
+    For internal state that is never read by people; use write_json or
+    write_yaml for anything a user may open.
+    """
+    write_atomic(path, msgspec.msgpack.encode(data))
+
+
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Files in this size range are hashed through mmap. Smaller files aren't
+# worth the mapping; larger ones could thrash on machines short of RAM.
+_MMAP_MIN_SIZE = 16 * 1024 * 1024
+_MMAP_MAX_SIZE = 2 * 1024 * 1024 * 1024
+
+
+# absolute path -> (size, mtime_ns, hexdigest), for this process only
+_CHECKSUM_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def file_checksum(path: Path | str) -> str:
+    """Compute SHA-256 checksum of a file.
+
+    Digests are cached by (path, size, mtime_ns), so re-hashing an
+    unchanged file costs one stat().
+    """
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    hit = _CHECKSUM_CACHE.get(key)
+    if hit is not None and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+        return hit[2]
+    digest = _hash_file(path)
+    _CHECKSUM_CACHE[key] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def _hash_file(path: Path | str) -> str:
+    use_mmap = _MMAP_MIN_SIZE <= os.path.getsize(path) <= _MMAP_MAX_SIZE
+    with open(path, "rb", buffering=0) as f:
+        if not use_mmap and hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashlib drives the read loop itself
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        h = hashlib.sha256()
+        if use_mmap:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        else:
+            # Reuse one buffer instead of allocating a bytes object per chunk
+            buf = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
     return h.hexdigest()
+
+
+def find_missing(paths: Iterable[Path]) -> set[Path]:
+    """Return the subset of paths that do not exist.
+
+    Lists each distinct parent directory once with os.scandir instead of
+    stat-ing every path, which matters on network filesystems.
+    """
+    by_parent: dict[Path, list[Path]] = defaultdict(list)
+    for path in paths:
+        by_parent[path.parent].append(path)
+
+    missing: set[Path] = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                existing = {entry.name for entry in it}
+        except OSError:
+            existing = set()
+        missing.update(p for p in children if p.name not in existing)
+    return missing
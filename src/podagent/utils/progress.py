@@ -2,26 +2,122 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import os
+import sys
+import time
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+_STDERR_IS_TTY = sys.stderr.isatty()
 
-console = Console(stderr=True)
+# Built on first use so importing this module (and every module that logs)
+# doesn't pay for Rich's import and terminal detection.
+_console = None
 
 
-def log(message: str, *, style: str = "bold") -> None:
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        # Configured once for log output: no highlighter, emoji or per-print
+        # width probing when stderr isn't a terminal.
+        _console = Console(
+            stderr=True,
+            highlight=False,
+            soft_wrap=True,
+            emoji=False,
+            log_time=False,
+            log_path=False,
+            width=None if _STDERR_IS_TTY else 120,
+        )
+    return _console
+
+
+def __getattr__(name: str):
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+DEBUG = 10
+INFO = 20
+WARN = 30
+ERROR = 40
+
+_LEVEL_NAMES = {
+    "DEBUG": DEBUG,
+    "INFO": INFO,
+    "WARN": WARN,
+    "WARNING": WARN,
+    "ERROR": ERROR,
+}
+
+
+def _parse_log_level(value: str | None) -> int:
+    """Parse PODAGENT_LOG_LEVEL as a level name or number; default to INFO."""
+    if not value:
+        return INFO
+    value = value.strip()
+    if value.upper() in _LEVEL_NAMES:
+        return _LEVEL_NAMES[value.upper()]
+    try:
+        return int(value)
+    except ValueError:
+        return INFO
+
+
+# Messages below this level are dropped before any formatting work
+LOG_LEVEL = _parse_log_level(os.environ.get("PODAGENT_LOG_LEVEL"))
+
+_TS_PREFIX = "[dim]\\[{}][/dim] "
+_SUMMARY_TABLE_OPTIONS = {"show_header": False, "box": None, "padding": (0, 2)}
+
+
+# (epoch second, HH:MM:SS, markup prefix); replaced as one tuple so threads
+# never see a second paired with another second's strings.
+_ts_cache: tuple[int, str, str] = (-1, "", "")
+
+
+def _clock() -> tuple[str, str]:
+    """Return (HH:MM:SS, markup prefix), formatting at most once per second."""
+    global _ts_cache
+    cached = _ts_cache
+    now = int(time.time())
+    if now != cached[0]:
+        ts = time.strftime("%H:%M:%S", time.localtime(now))
+        cached = _ts_cache = (now, ts, _TS_PREFIX.format(ts))
+    return cached[1], cached[2]
+
+
+def _timestamp() -> str:
+    return _clock()[1]
+
+
+def _plain_log(message: str) -> None:
+    """Write a log line without Rich rendering (stderr is not a terminal)."""
+    from rich.markup import render
+
+    sys.stderr.write(f"[{_clock()[0]}] {render(message).plain}\n")
+
+
+def log(message: str, *, style: str = "bold", level: int = INFO) -> None:
     """Log a timestamped message."""
-    ts = datetime.now().strftime("%H:%M:%S")
-    console.print(f"[dim]\\[{ts}][/dim] {message}", style=style, highlight=False)
+    if level < LOG_LEVEL:
+        return
+    if not _STDERR_IS_TTY:
+        _plain_log(message)
+        return
+    _get_console().print(_timestamp() + message, style=style, highlight=False)
 
 
-def log_step(step: str, message: str) -> None:
+def log_step(step: str, message: str, level: int = INFO) -> None:
     """Log a processing step."""
-    ts = datetime.now().strftime("%H:%M:%S")
-    console.print(
-        f"[dim]\\[{ts}][/dim] [bold cyan]{step}[/bold cyan] {message}",
+    if level < LOG_LEVEL:
+        return
+    if not _STDERR_IS_TTY:
+        _plain_log(f"{step} {message}")
+        return
+    _get_console().print(
+        f"{_timestamp()}[bold cyan]{step}[/bold cyan] {message}",
         highlight=False,
     )
 
@@ -33,17 +129,20 @@ def log_success(message: str) -> None:
 
 def log_warning(message: str) -> None:
     """Log a warning message."""
-    log(f"[yellow]⚠[/yellow] {message}", style="")
+    log(f"[yellow]⚠[/yellow] {message}", style="", level=WARN)
 
 
 def log_error(message: str) -> None:
     """Log an error message."""
-    log(f"[red]✗[/red] {message}", style="")
+    log(f"[red]✗[/red] {message}", style="", level=ERROR)
 
 
 def show_stage_summary(stage: str, duration_seconds: float, details: dict) -> None:
     """Show a summary panel for a completed stage."""
-    table = Table(show_header=False, box=None, padding=(0, 2))
+    from rich.panel import Panel
+    from rich.table import Table
+
+    table = Table(**_SUMMARY_TABLE_OPTIONS)
     table.add_column(style="bold")
     table.add_column()
 
@@ -54,4 +153,7 @@ def show_stage_summary(stage: str, duration_seconds: float, details: dict) -> No
     secs = int(duration_seconds) % 60
     table.add_row("Duration", f"{mins}m{secs:02d}s")
 
-    console.print(Panel(table, title=f"[bold]{stage} Complete[/bold]", border_style="green"))
+    _get_console().print(
+        Panel(table, title=f"[bold]{stage} Complete[/bold]", border_style="green"),
+        highlight=False,
+    )
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 
+def _transient_errors() -> tuple[type[BaseException], ...]:
+    """Network errors worth retrying.
+
+    Plain OSError is excluded: ENOSPC, EACCES and friends will not fix
+    themselves on the next attempt.
+    """
+    errors: tuple[type[BaseException], ...] = (
+        TimeoutError,
+        asyncio.TimeoutError,
+        ConnectionError,
+    )
+    try:
+        import httpx
+    except ImportError:
+        return errors
+    return errors + (httpx.TransportError,)
+
+
 def retry_api(max_attempts: int = 3):
-    """Retry decorator for API calls with exponential backoff."""
+    """Retry decorator for API calls with jittered exponential backoff."""
     return retry(
         stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=1, max=30),
-        retry=retry_if_exception_type((TimeoutError, ConnectionError, OSError)),
+        wait=wait_random_exponential(multiplier=1, min=1, max=30),
+        retry=retry_if_exception_type(_transient_errors()),
         reraise=True,
     )
@@ -0,0 +1,61 @@
+"""Tests for the streaming crossfade."""
+
+from __future__ import annotations
+
+import pytest
+
+from podagent.mixing.crossfade import _crossfade_streaming, _fade_in_gain
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+
+SR = 8000
+
+
+def _write(path, value: float, seconds: float) -> None:
+    data = np.full((int(seconds * SR), 1), value, dtype=np.float32)
+    sf.write(path, data, SR, subtype="FLOAT")
+
+
+@pytest.mark.parametrize("curve", ["tri", "exp", "log"])
+def test_fade_in_gain_runs_from_silence_to_unity(curve):
+    t = np.linspace(0.0, 1.0, 101)
+    gain = _fade_in_gain(t, curve)
+
+    assert gain[0] == pytest.approx(0.0, abs=1e-4)
+    assert gain[-1] == pytest.approx(1.0)
+    assert np.all(np.diff(gain) >= 0)
+
+
+def test_fade_in_gain_unknown_curve():
+    assert _fade_in_gain(np.linspace(0.0, 1.0, 5), "qsin") is None
+
+
+@pytest.mark.parametrize("curve", ["tri", "exp", "log"])
+def test_crossfade_streaming_mixes_only_the_overlap(tmp_path, curve):
+    _write(tmp_path / "a.wav", 1.0, 1.0)
+    _write(tmp_path / "b.wav", 0.5, 1.0)
+    n = int(0.1 * SR)
+
+    assert _crossfade_streaming(
+        tmp_path / "a.wav", tmp_path / "b.wav", tmp_path / "out.wav", 0.1, curve
+    )
+    out, sr = sf.read(tmp_path / "out.wav", dtype="float32")
+
+    assert sr == SR
+    assert len(out) == 2 * SR - n
+    np.testing.assert_array_equal(out[:SR - n], 1.0)
+    np.testing.assert_array_equal(out[SR:], 0.5)
+    t = np.linspace(0.0, 1.0, n)
+    expected = _fade_in_gain(1.0 - t, curve) + 0.5 * _fade_in_gain(t, curve)
+    np.testing.assert_allclose(out[SR - n:SR], expected, rtol=1e-5, atol=1e-6)
+
+
+def test_crossfade_streaming_declines_mismatched_rates(tmp_path):
+    _write(tmp_path / "a.wav", 1.0, 1.0)
+    sf.write(tmp_path / "b.wav", np.zeros(SR // 2, dtype=np.float32), SR // 2)
+
+    assert not _crossfade_streaming(
+        tmp_path / "a.wav", tmp_path / "b.wav", tmp_path / "out.wav", 0.1, "tri"
+    )
+    assert not (tmp_path / "out.wav").exists()
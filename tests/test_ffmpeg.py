@@ -0,0 +1,51 @@
+"""Tests for FFmpeg argument builders."""
+
+from __future__ import annotations
+
+from podagent.utils.ffmpeg import (
+    INTERMEDIATE_CODEC,
+    build_extract_batches,
+    build_trim_concat_graph,
+)
+
+
+def test_build_extract_batches_reencodes_every_region():
+    regions = [(f"r{i}.wav", float(i), 1.5) for i in range(5)]
+
+    jobs = build_extract_batches("host.wav", regions, sample_rate=44100, batch_size=2)
+
+    assert len(jobs) == 3
+    assert all(job[:2] == ["-i", "host.wav"] for job in jobs)
+    args = [arg for job in jobs for arg in job]
+    assert "copy" not in args
+    assert args.count("-c:a") == 5
+    assert args.count(INTERMEDIATE_CODEC) == 5
+    assert jobs[2] == [
+        "-i", "host.wav",
+        "-map", "0:a:0",
+        "-ss", "4.0",
+        "-t", "1.5",
+        "-c:a", INTERMEDIATE_CODEC,
+        "-ar", "44100",
+        "-ac", "1",
+        "r4.wav",
+    ]
+
+
+def test_trim_concat_graph_filters_each_cut_before_concat():
+    graph = build_trim_concat_graph([(1.0, 2.0), (5.0, 7.5)], "acompressor=ratio=3")
+
+    assert graph.split(";") == [
+        "[0:a]asplit=2[s0][s1]",
+        "[s0]atrim=start=1.0:end=2.0,asetpts=PTS-STARTPTS,acompressor=ratio=3[a0]",
+        "[s1]atrim=start=5.0:end=7.5,asetpts=PTS-STARTPTS,acompressor=ratio=3[a1]",
+        "[a0][a1]concat=n=2:v=0:a=1[out]",
+    ]
+
+
+def test_trim_concat_graph_without_filter():
+    assert build_trim_concat_graph([(0.0, 1.0)]) == (
+        "[0:a]asplit=1[s0];"
+        "[s0]atrim=start=0.0:end=1.0,asetpts=PTS-STARTPTS[a0];"
+        "[a0]concat=n=1:v=0:a=1[out]"
+    )
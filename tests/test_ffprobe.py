@@ -0,0 +1,68 @@
+"""Tests for ffprobe result caching."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from podagent.utils import ffprobe
+
+_PROBE_OUTPUT = json.dumps({
+    "streams": [{
+        "codec_type": "audio",
+        "codec_name": "pcm_s24le",
+        "sample_rate": "48000",
+        "channels": 2,
+        "bits_per_raw_sample": "24",
+    }],
+    "format": {"format_name": "wav", "duration": "12.5"},
+})
+
+
+@pytest.fixture
+def ffprobe_calls(monkeypatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=_PROBE_OUTPUT, stderr="")
+
+    ffprobe._probe_cached.cache_clear()
+    monkeypatch.setattr(ffprobe.subprocess, "run", fake_run)
+    yield calls
+    ffprobe._probe_cached.cache_clear()
+
+
+def test_probe_audio_is_cached_until_file_changes(tmp_path: Path, ffprobe_calls):
+    path = tmp_path / "host.wav"
+    path.write_bytes(b"RIFF")
+
+    first = ffprobe.probe_audio(path)
+    assert ffprobe.probe_audio(path) is first
+    assert len(ffprobe_calls) == 1
+    assert first.format_short == "wav"
+    assert first.bit_depth == 24
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    ffprobe.probe_audio(path)
+    assert len(ffprobe_calls) == 2
+
+
+def test_probe_many_keeps_input_order(tmp_path: Path, ffprobe_calls):
+    paths = [tmp_path / f"track{i}.wav" for i in range(3)]
+    for p in paths:
+        p.write_bytes(b"RIFF")
+
+    infos = ffprobe.probe_many(paths)
+    assert [info.path for info in infos] == [str(p) for p in paths]
+
+
+def test_probe_audio_missing_file(tmp_path: Path, ffprobe_calls):
+    with pytest.raises(FileNotFoundError):
+        ffprobe.probe_audio(tmp_path / "missing.wav")
+    assert ffprobe_calls == []
@@ -0,0 +1,35 @@
+"""Tests for the gate review summaries."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from podagent.models.manifest import Manifest, Project
+from podagent.pipeline import gate
+
+
+def test_ingestion_gate_shows_placeholder_for_missing_values(
+    tmp_path: Path, monkeypatch
+):
+    manifest = Manifest(
+        project=Project(
+            name="show",
+            episode_number=1,
+            title="Pilot",
+            recording_date="2026-01-01",
+        )
+    )
+    transcript_path = tmp_path / manifest.files.transcript
+    transcript_path.parent.mkdir(parents=True, exist_ok=True)
+    transcript_path.write_text(json.dumps({"segments": [{"text": "hi"}]}))
+
+    rows: dict[str, str] = {}
+    monkeypatch.setattr(
+        gate, "_print_metrics", lambda title, metrics: rows.update(metrics)
+    )
+    gate._show_ingestion_gate(tmp_path, manifest)
+
+    assert rows["Words"] == "?"
+    assert rows["Language"] == "?"
+    assert rows["Speakers"] == "?"
@@ -0,0 +1,133 @@
+"""Tests for the file I/O helpers."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from podagent.utils import io
+
+
+def _fail_writes(monkeypatch) -> None:
+    def fail(fd, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(io.os, "write", fail)
+
+
+def test_failed_first_write_leaves_no_file(tmp_path: Path, monkeypatch):
+    path = tmp_path / "state.json"
+    _fail_writes(monkeypatch)
+
+    with pytest.raises(OSError, match="disk full"):
+        io.write_json(path, {"a": 1})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_overwrite_keeps_previous_contents(tmp_path: Path, monkeypatch):
+    path = tmp_path / "state.json"
+    io.write_json(path, {"a": 1})
+    _fail_writes(monkeypatch)
+
+    with pytest.raises(OSError, match="disk full"):
+        io.write_json(path, {"a": 2})
+
+    assert io.read_json(path) == {"a": 1}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def _backdate(path: Path) -> int:
+    io.os.utime(path, ns=(0, 0))
+    return path.stat().st_mtime_ns
+
+
+def test_write_atomic_rewrites_unchanged_contents_by_default(tmp_path: Path):
+    path = tmp_path / "notes.md"
+    io.write_atomic(path, "same")
+    before = _backdate(path)
+
+    io.write_atomic(path, "same")
+    assert path.stat().st_mtime_ns != before
+
+
+def test_write_atomic_if_changed_skips_identical_contents(tmp_path: Path):
+    path = tmp_path / "notes.md"
+    io.write_atomic(path, "same")
+    before = _backdate(path)
+
+    io.write_atomic(path, "same", if_changed=True)
+    assert path.stat().st_mtime_ns == before
+
+    io.write_atomic(path, "different", if_changed=True)
+    assert path.read_text() == "different"
+
+
+def test_file_checksum_is_cached_until_file_changes(tmp_path: Path, monkeypatch):
+    path = tmp_path / "host.wav"
+    path.write_bytes(b"RIFF" * 1000)
+    expected = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    hashed: list[str] = []
+    real_hash_file = io._hash_file
+    monkeypatch.setattr(
+        io, "_hash_file", lambda p, *args: hashed.append(p) or real_hash_file(p, *args)
+    )
+
+    assert io.file_checksum(path) == expected
+    assert io.file_checksum(path) == expected
+    assert len(hashed) == 1
+
+    path.write_bytes(b"RIFF" * 1001)
+    assert io.file_checksum(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert len(hashed) == 2
+
+
+@pytest.mark.parametrize("mmap_min_size", [0, 1 << 40])
+def test_file_checksum_matches_sha256(tmp_path: Path, monkeypatch, mmap_min_size):
+    monkeypatch.setattr(io, "_MMAP_MIN_SIZE", mmap_min_size)
+    path = tmp_path / "track.wav"
+    path.write_bytes(bytes(range(256)) * 4096)
+
+    assert io._hash_file(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_read_yaml_uses_yaml_12_scalars(tmp_path: Path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "language: no\n"
+        "flag: on\n"
+        "answer: yes\n"
+        "t: 1:30\n"
+        "enabled: true\n"
+        "disabled: False\n"
+        "count: 010\n"
+        "mask: 0x1F\n"
+        "ratio: -.5\n"
+        "gain: 1e3\n"
+        "missing: null\n"
+    )
+
+    assert io.read_yaml(path) == {
+        "language": "no",
+        "flag": "on",
+        "answer": "yes",
+        "t": "1:30",
+        "enabled": True,
+        "disabled": False,
+        "count": 10,
+        "mask": 31,
+        "ratio": -0.5,
+        "gain": 1000.0,
+        "missing": None,
+    }
+
+
+def test_yaml_round_trips_strings_that_look_like_yaml_11_scalars(tmp_path: Path):
+    path = tmp_path / "manifest.yaml"
+    data = {"language": "no", "flag": "on", "t": "1:30", "n": 5, "ok": True}
+
+    io.write_yaml(path, data)
+    assert io.read_yaml(path) == data
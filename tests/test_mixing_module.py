@@ -0,0 +1,78 @@
+"""Tests for the mixing module's single-pass assembly."""
+
+from __future__ import annotations
+
+import pytest
+
+from podagent.mixing import module as mixing_module
+from podagent.mixing.module import MixingModule
+from podagent.mixing.processing import build_filter_chain
+from podagent.mixing.timeline import AudioRegion
+from podagent.models.config import MixingConfig
+from podagent.utils.ffmpeg import FFmpegError
+
+
+def _region(edit_id: str, start: float, end: float, track: str = "host.wav") -> AudioRegion:
+    return AudioRegion(
+        edit_id=edit_id,
+        track_path=track,
+        source_start=start,
+        source_end=end,
+        record_start=0.0,
+        record_end=end - start,
+        speaker="host",
+        offset_ms=250.0,
+    )
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls: list[tuple] = []
+
+    def fake_extract_and_filter(track_path, output_path, cuts, audio_filter, **kwargs):
+        calls.append((track_path, output_path, cuts, audio_filter))
+
+    monkeypatch.setattr(mixing_module, "extract_and_filter", fake_extract_and_filter)
+    return calls
+
+
+def test_single_pass_not_used_with_default_crossfade(tmp_path, calls):
+    regions = [_region("keep-001", 0.0, 1.0), _region("keep-002", 2.0, 3.0)]
+
+    assert MixingModule()._assemble_single_pass(regions, tmp_path, tmp_path, MixingConfig()) is None
+    assert calls == []
+
+
+def test_single_pass_not_used_across_tracks(tmp_path, calls):
+    regions = [_region("keep-001", 0.0, 1.0), _region("keep-002", 2.0, 3.0, "guest.wav")]
+    config = MixingConfig(crossfade_duration_ms=0)
+
+    assert MixingModule()._assemble_single_pass(regions, tmp_path, tmp_path, config) is None
+    assert calls == []
+
+
+def test_single_pass_extracts_aligned_cuts_with_processing_chain(tmp_path, calls):
+    regions = [_region("keep-001", 0.0, 1.0), _region("keep-002", 2.0, 3.0)]
+    config = MixingConfig(crossfade_duration_ms=0)
+
+    result = MixingModule()._assemble_single_pass(regions, tmp_path, tmp_path, config)
+
+    audio_filter, steps = build_filter_chain(config)
+    assert result == (tmp_path / "assembled.wav", {"host.wav": steps}, 0)
+    assert calls == [(
+        tmp_path / "host.wav",
+        tmp_path / "assembled.wav",
+        [(0.25, 1.25), (2.25, 3.25)],
+        audio_filter,
+    )]
+
+
+def test_single_pass_falls_back_when_ffmpeg_fails(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise FFmpegError(["ffmpeg"], 1, "graph too large")
+
+    monkeypatch.setattr(mixing_module, "extract_and_filter", fail)
+    regions = [_region("keep-001", 0.0, 1.0)]
+    config = MixingConfig(crossfade_duration_ms=0)
+
+    assert MixingModule()._assemble_single_pass(regions, tmp_path, tmp_path, config) is None
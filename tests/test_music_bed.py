@@ -0,0 +1,84 @@
+"""Tests for intro music ducking."""
+
+from __future__ import annotations
+
+import pytest
+
+from podagent.mixing.music_bed import _ducking_envelope, mix_intro_music_numpy
+from podagent.mixing.timeline import AudioRegion, speech_in_record_time
+from podagent.models.transcript import Segment
+
+SR = 8000
+
+
+def _region(source_start: float, source_end: float, record_start: float) -> AudioRegion:
+    return AudioRegion(
+        edit_id="keep",
+        track_path="host.wav",
+        source_start=source_start,
+        source_end=source_end,
+        record_start=record_start,
+        record_end=record_start + source_end - source_start,
+        speaker="host",
+        offset_ms=0.0,
+    )
+
+
+def _segment(start: float, end: float) -> Segment:
+    return Segment(id=f"s{start}", speaker="host", start=start, end=end, text="hi")
+
+
+def test_speech_in_record_time_keeps_pauses_and_shifts_past_cuts():
+    # Keep 0-4s, cut 4-6s, keep 6-10s (plays at 4-8s on the output)
+    regions = [_region(0.0, 4.0, 0.0), _region(6.0, 10.0, 4.0)]
+    segments = [_segment(0.5, 1.0), _segment(3.0, 5.0), _segment(7.0, 8.0)]
+
+    assert speech_in_record_time(regions, segments) == [
+        (0.5, 1.0),
+        (3.0, 4.0),  # clipped at the cut
+        (5.0, 6.0),
+    ]
+
+
+def test_ducking_envelope_returns_to_full_level_between_speech():
+    pytest.importorskip("scipy")
+    envelope = _ducking_envelope(
+        4 * SR, SR, [(0.5, 1.0), (2.5, 3.0)], duck_db=-12.0, ramp_ms=100
+    )
+    duck = 10 ** (-12 / 20)
+
+    assert envelope[int(0.1 * SR)] == pytest.approx(1.0)
+    assert envelope[int(0.75 * SR)] == pytest.approx(duck, rel=1e-4)
+    # The pause between the two segments is back at unity
+    assert envelope[int(1.75 * SR)] == pytest.approx(1.0)
+    assert envelope[int(2.75 * SR)] == pytest.approx(duck, rel=1e-4)
+    assert envelope[int(3.5 * SR)] == pytest.approx(1.0)
+
+
+def test_mix_intro_music_numpy_ducks_only_under_speech(tmp_path):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    sf = pytest.importorskip("soundfile")
+    speech = np.zeros((6 * SR, 1), dtype=np.float32)
+    speech[4 * SR:] = 0.25  # past the end of the music
+    music = np.full((3 * SR, 1), 0.5, dtype=np.float32)
+    sf.write(tmp_path / "speech.wav", speech, SR, subtype="FLOAT")
+    sf.write(tmp_path / "music.wav", music, SR, subtype="FLOAT")
+
+    mix_intro_music_numpy(
+        tmp_path / "speech.wav",
+        tmp_path / "music.wav",
+        tmp_path / "out.wav",
+        [(0.5, 1.0)],
+        music_volume_db=0.0,
+        duck_db=-12.0,
+        ramp_ms=50,
+    )
+    out, sr = sf.read(tmp_path / "out.wav", dtype="float32", always_2d=True)
+
+    assert sr == SR
+    assert out.shape == speech.shape
+    assert out[int(0.75 * SR), 0] == pytest.approx(0.5 * 10 ** (-12 / 20), rel=1e-4)
+    assert out[int(2.0 * SR), 0] == pytest.approx(0.5)
+    # Everything after the music is copied through untouched
+    np.testing.assert_array_equal(out[3 * SR:], speech[3 * SR:])
@@ -0,0 +1,154 @@
+"""Tests for manifest checkpointing and pipeline resume."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from podagent.models.manifest import Manifest, Project, dump_manifest
+from podagent.pipeline import gate, orchestrator
+from podagent.pipeline.orchestrator import (
+    _checkpoint_path,
+    _save_manifest,
+    load_manifest,
+    run_pipeline,
+)
+from podagent.utils.io import read_msgpack, read_yaml, write_yaml
+
+
+def _manifest() -> Manifest:
+    return Manifest(
+        project=Project(
+            name="show",
+            episode_number=1,
+            title="Pilot",
+            recording_date="2026-01-01",
+        )
+    )
+
+
+def _make_checkpoint_newer(manifest_path: Path) -> None:
+    # Filesystem timestamps can be coarse; don't rely on write order alone
+    mtime = manifest_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(_checkpoint_path(manifest_path), ns=(mtime, mtime))
+
+
+@pytest.fixture
+def manifest_path(tmp_path: Path) -> Path:
+    path = tmp_path / "manifest.yaml"
+    _save_manifest(path, _manifest(), final=True)
+    return path
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load_prefers_newer_checkpoint(manifest_path, validate):
+    manifest = load_manifest(manifest_path)
+    manifest.get_stage("ingestion").status = "in_progress"
+    _save_manifest(manifest_path, manifest)
+    _make_checkpoint_newer(manifest_path)
+
+    assert read_yaml(manifest_path)["pipeline"]["stages"]["ingestion"]["status"] == "pending"
+    loaded = load_manifest(manifest_path, validate=validate)
+    assert loaded.get_stage("ingestion").status == "in_progress"
+    assert loaded.project.title == "Pilot"
+
+
+def test_load_ignores_older_checkpoint(manifest_path):
+    manifest = load_manifest(manifest_path)
+    manifest.get_stage("ingestion").status = "in_progress"
+    _save_manifest(manifest_path, manifest)
+    os.utime(_checkpoint_path(manifest_path), ns=(0, 0))
+
+    assert load_manifest(manifest_path).get_stage("ingestion").status == "pending"
+
+
+def test_final_save_removes_checkpoint(manifest_path):
+    manifest = load_manifest(manifest_path)
+    _save_manifest(manifest_path, manifest)
+    assert _checkpoint_path(manifest_path).exists()
+
+    _save_manifest(manifest_path, manifest, final=True)
+    assert not _checkpoint_path(manifest_path).exists()
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_timestamps_are_iso_in_yaml_and_epoch_in_checkpoint(manifest_path, validate):
+    started = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+    manifest = load_manifest(manifest_path)
+    manifest.get_stage("ingestion").started_at = started
+
+    _save_manifest(manifest_path, manifest)
+    _make_checkpoint_newer(manifest_path)
+    checkpoint = read_msgpack(_checkpoint_path(manifest_path))
+    assert checkpoint["pipeline"]["stages"]["ingestion"]["started_at"] == started.timestamp()
+    assert load_manifest(manifest_path, validate=validate).get_stage(
+        "ingestion"
+    ).started_at == started
+
+    _save_manifest(manifest_path, manifest, final=True)
+    stage = read_yaml(manifest_path)["pipeline"]["stages"]["ingestion"]
+    assert stage["started_at"] == "2026-01-01T12:30:00Z"
+    assert load_manifest(manifest_path, validate=validate).get_stage(
+        "ingestion"
+    ).started_at == started
+
+
+def test_hand_edited_yaml_is_always_validated(manifest_path):
+    data = read_yaml(manifest_path)
+    data["project"]["participants"] = None
+    write_yaml(manifest_path, data)
+
+    with pytest.raises(ValidationError):
+        load_manifest(manifest_path, validate=False)
+
+
+class _FakeModule:
+    def __init__(self, name: str, calls: list[str], fail: bool = False):
+        self.name = name
+        self.calls = calls
+        self.fail = fail
+
+    def validate_inputs(self, project_root, manifest):
+        return []
+
+    def run(self, project_root, manifest):
+        self.calls.append(self.name)
+        if self.fail:
+            raise RuntimeError(f"{self.name} broke")
+
+
+def test_run_pipeline_resumes_from_failed_stage(manifest_path, monkeypatch):
+    calls: list[str] = []
+    failing = {"mixing"}
+    monkeypatch.setattr(
+        orchestrator,
+        "_load_module",
+        lambda name: _FakeModule(name, calls, fail=name in failing),
+    )
+    monkeypatch.setattr(gate, "present_gate", lambda *args: True)
+
+    with pytest.raises(RuntimeError, match="mixing broke"):
+        run_pipeline(manifest_path)
+
+    assert calls == ["ingestion", "editing", "mixing"]
+    assert not _checkpoint_path(manifest_path).exists()
+    stages = read_yaml(manifest_path)["pipeline"]["stages"]
+    assert stages["editing"]["status"] == "completed"
+    assert stages["editing"]["gate_approved"] is True
+    assert stages["mixing"]["status"] == "failed"
+    assert stages["mixing"]["error"]["message"] == "mixing broke"
+
+    calls.clear()
+    failing.clear()
+    run_pipeline(manifest_path)
+
+    assert calls == ["mixing", "mastering"]
+    manifest = load_manifest(manifest_path)
+    assert all(
+        manifest.get_stage(name).status == "completed" for name in orchestrator.STAGE_ORDER
+    )
+    assert dump_manifest(manifest)["pipeline"]["stages"]["mastering"]["gate_approved"] is True
@@ -0,0 +1,45 @@
+"""Tests for the API retry decorator."""
+
+from __future__ import annotations
+
+import pytest
+
+from podagent.utils.retry import retry_api
+
+
+def _flaky(exc: BaseException, failures: int):
+    calls = []
+
+    @retry_api(max_attempts=3)
+    def call():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise exc
+        return "ok"
+
+    call.retry.sleep = lambda seconds: None
+    return call, calls
+
+
+def test_retries_transient_errors():
+    call, calls = _flaky(ConnectionError("reset"), failures=2)
+    assert call() == "ok"
+    assert len(calls) == 3
+
+
+def test_does_not_retry_plain_os_errors():
+    call, calls = _flaky(OSError("no space left on device"), failures=1)
+    with pytest.raises(OSError):
+        call()
+    assert len(calls) == 1
+
+
+def test_backoff_waits_at_least_one_second():
+    call, _ = _flaky(TimeoutError(), failures=0)
+    wait = call.retry.wait
+    assert all(1 <= wait(_RetryState(n)) <= 30 for n in range(1, 10) for _ in range(20))
+
+
+class _RetryState:
+    def __init__(self, attempt_number: int):
+        self.attempt_number = attempt_number